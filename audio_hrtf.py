@@ -5,11 +5,13 @@ Implements robust HRTF, distance attenuation, and Doppler effects using OpenAL.
 PATENT-WORTHY: True 3D spatial audio for assistive navigation.
 """
 
+import ctypes
 import time
 import threading
 import math
 import os
 import sys
+import numpy as np
 import config
 
 # Try to import OpenAL
@@ -20,6 +22,9 @@ except ImportError:
     print("❌ PyOpenAL not installed. Falling back to dummy audio.")
     OPENAL_AVAILABLE = False
 
+# ALC_SOFT_HRTF context attribute (not exported by every PyOpenAL version)
+ALC_HRTF_SOFT_ATTR = 0x1992
+
 class HRTF_AudioController:
     """
     Advanced spatial audio using OpenAL.
@@ -31,35 +36,44 @@ class HRTF_AudioController:
         global OPENAL_AVAILABLE
         self.running = False
         self.sources = {} # Map obj_id -> OpenAL Source
+        self.position_buffers = {} # Map obj_id -> reusable ctypes float[3] for AL_POSITION
+        self.source_pool = [] # Every OpenAL Source we own
+        self.free_sources = [] # Pooled sources not currently bound to an object
         self.buffers = {} # Map signature_name -> OpenAL Buffer
+        self.label_buffers = {} # Map object label -> resolved OpenAL Buffer
         self.listener_pos = (0, 0, 0)
         self.listener_ori = (0, 0, -1, 0, 1, 0) # Looking -Z, Up +Y
+        self.device = None # Set when we own the device/context (HRTF path)
+        self.context = None
         
         if not OPENAL_AVAILABLE:
             print("⚠️ OpenAL unavailable. Audio disabled.")
             return
 
         try:
-            # Initialize OpenAL
-            # oalInit returns void, throws exception on failure in some bindings, 
-            # or we might need to create context manually if PyOpenAL helper doesn't work.
-            # PyOpenAL's oalInit() is a helper that opens default device and context.
-            oalInit()
+            # Initialize OpenAL with HRTF explicitly requested on the context,
+            # so binaural rendering doesn't depend on alsoft.conf
+            self._init_hrtf_context()
             
             # Configure Listener
             # PyOpenAL expects ctypes arrays for vector functions
-            import ctypes
             listener_pos_array = (ctypes.c_float * 3)(*self.listener_pos)
             listener_ori_array = (ctypes.c_float * 6)(*self.listener_ori)
             
             alListenerfv(AL_POSITION, listener_pos_array)
             alListenerfv(AL_ORIENTATION, listener_ori_array)
             
-            # Check for HRTF extension (optional, but good to know)
-            # Note: OpenAL Soft usually enables HRTF by default if headphones are detected
-            # or configured in alsoft.conf. We can't easily force it via simple API 
-            # without AL_SOFT_HRTF extension, but we assume the system is configured.
+            # Pre-allocate a pool of sources in one driver call
+            pool_size = config.OPENAL_SOURCE_POOL_SIZE
+            pool = (ctypes.c_uint * pool_size)()
+            alGenSources(pool_size, pool)
+            self.source_pool = list(pool)
+            self.free_sources = list(pool)
             
+            # HRTF was requested via ALC_HRTF_SOFT in _init_hrtf_context(). If that
+            # context failed and we fell back to oalInit(), OpenAL Soft only uses
+            # HRTF when it auto-detects headphones or alsoft.conf enables it.
+
             print("🎧 OpenAL Audio System Initialized")
             print(f"   Vendor: {alGetString(AL_VENDOR).decode('utf-8')}")
             print(f"   Renderer: {alGetString(AL_RENDERER).decode('utf-8')}")
@@ -71,6 +85,24 @@ class HRTF_AudioController:
             print(f"❌ Failed to initialize OpenAL: {e}")
             OPENAL_AVAILABLE = False
 
+    def _init_hrtf_context(self):
+        """Open the default device with an ALC_HRTF_SOFT context, or fall back to oalInit()."""
+        device = alcOpenDevice(None)
+        if device:
+            attrs = (ctypes.c_int * 3)(ALC_HRTF_SOFT_ATTR, ALC_TRUE, 0)
+            context = alcCreateContext(device, attrs)
+            if context and alcMakeContextCurrent(context):
+                self.device = device
+                self.context = context
+                print("   HRTF requested via ALC_HRTF_SOFT")
+                return
+            if context:
+                alcDestroyContext(context)
+            alcCloseDevice(device)
+        
+        # PyOpenAL's oalInit() is a helper that opens default device and context.
+        oalInit()
+
     def _preload_buffers(self):
         """Pre-load audio signatures into OpenAL buffers."""
         if not OPENAL_AVAILABLE:
@@ -78,54 +110,49 @@ class HRTF_AudioController:
             
         print("🎵 Loading audio signatures...")
         try:
-            from audio_module_multi import AudioSignatureGenerator
-            import wave
-            import struct
-            
             # We need to generate WAV data for OpenAL
             # OpenAL expects PCM data.
             
-            for obj_type, sig_config in config.AUDIO_SIGNATURES.items():
+            # Create all OpenAL Buffers in one call
+            # alGenBuffers(n, buffers_array)
+            n_buffers = len(config.AUDIO_SIGNATURES)
+            buf_ids = (ctypes.c_uint * n_buffers)()
+            alGenBuffers(n_buffers, buf_ids)
+            
+            for i, (obj_type, sig_config) in enumerate(config.AUDIO_SIGNATURES.items()):
                 waveform_type = sig_config.get("waveform", "sine")
                 frequency = sig_config.get("freq", 440)
                 duration = 0.5 # seconds
                 sample_rate = 44100
                 
-                # Generate raw PCM data (16-bit mono)
-                # We'll use a helper to generate the byte string
+                # Generate raw PCM data (16-bit mono), whole buffer at once
                 frames = int(sample_rate * duration)
-                audio_data = bytearray()
+                t = np.arange(frames, dtype=np.float32) / sample_rate
+                phase = 2 * np.pi * frequency * t
+                
+                if waveform_type == "sine":
+                    wave = 0.5 * np.sin(phase)
+                elif waveform_type == "square":
+                    wave = 0.5 * np.where(np.sin(phase) > 0, 1.0, -1.0)
+                elif waveform_type == "sawtooth":
+                    wave = 0.5 * (2.0 * (t * frequency - np.floor(t * frequency + 0.5)))
+                else:
+                    wave = np.zeros(frames, dtype=np.float32)
+                
+                # Apply envelope (attack/decay) to avoid clicking
+                env = np.ones(frames, dtype=np.float32)
+                env[:1000] = np.arange(1000) / 1000.0  # Attack
+                env[-999:] = np.arange(999, 0, -1) / 1000.0  # Decay
                 
-                for i in range(frames):
-                    t = float(i) / sample_rate
-                    if waveform_type == "sine":
-                        sample = 0.5 * math.sin(2 * math.pi * frequency * t)
-                    elif waveform_type == "square":
-                        sample = 0.5 * (1.0 if math.sin(2 * math.pi * frequency * t) > 0 else -1.0)
-                    elif waveform_type == "sawtooth":
-                        sample = 0.5 * (2.0 * (t * frequency - math.floor(t * frequency + 0.5)))
-                    else:
-                        sample = 0.0
-                        
-                    # Apply envelope (attack/decay) to avoid clicking
-                    if i < 1000: # Attack
-                        sample *= (i / 1000.0)
-                    elif i > frames - 1000: # Decay
-                        sample *= ((frames - i) / 1000.0)
-                        
-                    # Convert to 16-bit signed integer
-                    val = int(max(min(sample, 1.0), -1.0) * 32767)
-                    audio_data.extend(struct.pack('<h', val))
+                # Convert to 16-bit signed integer
+                pcm = np.clip(wave * env, -1.0, 1.0).astype(np.float32)
+                audio_data = (pcm * 32767).astype('<i2').tobytes()
                 
-                # Create OpenAL Buffer
-                # alGenBuffers(n, buffers_array)
-                buf_id = ctypes.c_uint(0)
-                alGenBuffers(1, ctypes.byref(buf_id))
-                buf = buf_id.value
+                buf = buf_ids[i]
                 
                 # alBufferData(buffer, format, data, size, freq)
                 # data needs to be a pointer
-                data_ptr = (ctypes.c_char * len(audio_data)).from_buffer(audio_data)
+                data_ptr = ctypes.c_char_p(audio_data)
                 alBufferData(buf, AL_FORMAT_MONO16, data_ptr, len(audio_data), sample_rate)
                 
                 self.buffers[obj_type] = buf
@@ -154,23 +181,20 @@ class HRTF_AudioController:
     def _play_startup_sound(self):
         """Play a quick startup tone."""
         try:
-            import ctypes
             # Generate a simple beep
             sample_rate = 44100
             duration = 0.5
             frames = int(sample_rate * duration)
-            audio_data = bytearray()
-            for i in range(frames):
-                t = float(i) / sample_rate
-                sample = 0.3 * math.sin(2 * math.pi * 880 * t) * ((frames - i) / frames)
-                val = int(sample * 32767)
-                audio_data.extend(struct.pack('<h', val))
-                
+            t = np.arange(frames, dtype=np.float32) / sample_rate
+            envelope = (frames - np.arange(frames, dtype=np.float32)) / frames
+            sample = 0.3 * np.sin(2 * np.pi * 880 * t) * envelope
+            audio_data = (sample * 32767).astype('<i2').tobytes()
+            
             buf_id = ctypes.c_uint(0)
             alGenBuffers(1, ctypes.byref(buf_id))
             buf = buf_id.value
             
-            data_ptr = (ctypes.c_char * len(audio_data)).from_buffer(audio_data)
+            data_ptr = ctypes.c_char_p(audio_data)
             alBufferData(buf, AL_FORMAT_MONO16, data_ptr, len(audio_data), sample_rate)
             
             source_id = ctypes.c_uint(0)
@@ -193,21 +217,34 @@ class HRTF_AudioController:
         self.running = False
         if OPENAL_AVAILABLE:
             try:
-                import ctypes
                 # Stop all sources
                 for source in self.sources.values():
                     alSourceStop(source)
-                    source_id = ctypes.c_uint(source)
-                    alDeleteSources(1, ctypes.byref(source_id))
                 self.sources.clear()
+                self.position_buffers.clear()
+                
+                # Release the whole source pool
+                if self.source_pool:
+                    source_ids = (ctypes.c_uint * len(self.source_pool))(*self.source_pool)
+                    alDeleteSources(len(self.source_pool), source_ids)
+                self.source_pool = []
+                self.free_sources = []
                 
                 # Clean up buffers
-                for buf in self.buffers.values():
-                    buf_id = ctypes.c_uint(buf)
-                    alDeleteBuffers(1, ctypes.byref(buf_id))
+                if self.buffers:
+                    buf_ids = (ctypes.c_uint * len(self.buffers))(*self.buffers.values())
+                    alDeleteBuffers(len(self.buffers), buf_ids)
                 self.buffers.clear()
+                self.label_buffers.clear()
                 
-                oalQuit()
+                if self.context:
+                    alcMakeContextCurrent(None)
+                    alcDestroyContext(self.context)
+                    alcCloseDevice(self.device)
+                    self.context = None
+                    self.device = None
+                else:
+                    oalQuit()
             except Exception:
                 pass
         print("⏹️ OpenAL audio stopped")
@@ -221,102 +258,117 @@ class HRTF_AudioController:
         """Main loop to update source positions based on shared state."""
         while self.running:
             try:
-                if self.shared_state:
+                if not self.shared_state:
+                    time.sleep(0.05)
+                    continue
+                
+                # Only rebuild the scene when the vision thread publishes new results
+                if self.shared_state.wait_for_update(timeout=0.2):
                     display_state = self.shared_state.get_display_state()
                     objects = display_state.get("objects", [])
                     self._update_scene(objects)
                 
-                time.sleep(0.05) # Update at 20Hz
-                
             except Exception as e:
                 print(f"⚠️ Audio loop error: {e}")
                 time.sleep(1)
 
+    def _buffer_for_label(self, label):
+        """Resolve (and cache) the signature buffer for an object label."""
+        buf = self.label_buffers.get(label)
+        if buf is None:
+            sig_name = "default"
+            # Simple mapping based on label
+            if "person" in label: sig_name = "person"
+            elif "door" in label: sig_name = "door"
+            
+            buf = self.buffers.get(sig_name) or self.buffers.get("default")
+            self.label_buffers[label] = buf
+        return buf
+
     def _update_scene(self, objects):
         """Update OpenAL sources based on tracked objects."""
         if not OPENAL_AVAILABLE:
             return
-            
-        import ctypes
 
         current_ids = set()
         
+        # === THREAT FOCUS ===
+        # Find max threat score in current set (once per tick, not per object)
+        max_threat = max((getattr(o, 'threat_score', 0.0) for o in objects), default=0.0)
+        duck_threshold = max_threat * 0.8
+        
         # Debug: Log when we receive objects
         # if objects and len(objects) > 0:
         #     print(f"🔊 Audio: Processing {len(objects)} objects")
         
-        # 1. Update/Create Sources
-        for obj in objects:
-            if not obj.bbox:
-                continue
-                
+        # 1. Compute positions/gains for all objects in one vectorized pass
+        visible = [obj for obj in objects if obj.bbox]
+        if visible:
+            bboxes = np.array([obj.bbox for obj in visible], dtype=np.float32)
+        else:
+            bboxes = np.zeros((0, 4), dtype=np.float32)
+        
+        # Calculate 3D Position relative to camera
+        # Camera is at (0,0,0) looking down -Z
+        # X: Left/Right (- is left)
+        # Y: Up/Down (+ is up)
+        # Z: Forward/Back (- is forward)
+        
+        # Map bbox center to normalized coordinates (-1 to 1)
+        cx = bboxes[:, 0] + bboxes[:, 2] * 0.5
+        cy = bboxes[:, 1] + bboxes[:, 3] * 0.5
+        
+        # Assuming 1280x720 frame
+        width = 1280
+        height = 720
+        
+        # Normalize X (-1 left, +1 right)
+        norm_x = cx * (2.0 / width) - 1
+        
+        # Normalize Y (-1 bottom, +1 top) -> OpenAL Y is +Up
+        norm_y = -(cy * (2.0 / height) - 1)
+        
+        # Estimate Distance (Z) based on area (larger = closer)
+        # distance = 1.0 / sqrt(area_ratio), clamped to 0.5m - 10m
+        # distance 1.0 = roughly 1 meter away (screen filling 50%)
+        area = bboxes[:, 2] * bboxes[:, 3]
+        max_area = width * height * 0.5 # arbitrary reference
+        dists = np.clip(np.sqrt(max_area / (area + 1)), 0.5, 10.0)
+        
+        # Calculate Gain (Volume) based on Distance
+        # Simple inverse distance attenuation: gain = ref_dist / dist
+        # (0.5 factor to make it drop off slower), minimum volume 10%
+        ref_dist = 1.0
+        gains = np.clip(ref_dist / (dists * 0.5), 0.1, 1.0)
+        
+        # Convert to 3D coordinates (simple projection)
+        positions_x = norm_x * dists * 2.0 # Spread out horizontally
+        positions_y = norm_y * dists
+        positions_z = -dists
+        
+        # 2. Update/Create Sources
+        for i, obj in enumerate(visible):
             obj_id = obj.id
             current_ids.add(obj_id)
             
-            # Calculate 3D Position relative to camera
-            # Camera is at (0,0,0) looking down -Z
-            # X: Left/Right (- is left)
-            # Y: Up/Down (+ is up)
-            # Z: Forward/Back (- is forward)
-            
-            # Map bbox center to normalized coordinates (-1 to 1)
-            cx = obj.bbox[0] + obj.bbox[2] / 2
-            cy = obj.bbox[1] + obj.bbox[3] / 2
-            
-            # Assuming 1280x720 frame
-            width = 1280
-            height = 720
-            
-            # Normalize X (-1 left, +1 right)
-            norm_x = (cx / width) * 2 - 1
-            
-            # Normalize Y (-1 bottom, +1 top) -> OpenAL Y is +Up
-            norm_y = -((cy / height) * 2 - 1)
-            
-            # Estimate Distance (Z) based on area (larger = closer)
-            area = obj.bbox[2] * obj.bbox[3]
-            max_area = width * height * 0.5 # arbitrary reference
-            # distance = 1.0 / sqrt(area_ratio)
-            # Clamp distance to reasonable range (0.5m to 10m)
-            # distance 1.0 = roughly 1 meter away (screen filling 50%)
-            dist = max(0.5, min(10.0, math.sqrt(max_area / (area + 1))))
-            
-            # Calculate Gain (Volume) based on Distance
-            # Inverse distance model: Volume = Reference / Distance
-            # We want closer objects (dist ~ 0.5) to be loud (gain ~ 1.0)
-            # And far objects (dist ~ 5.0) to be quiet (gain ~ 0.1)
-            
-            # Reference distance where gain is 1.0
-            ref_dist = 1.0 
-            
-            # Simple inverse distance attenuation
-            # gain = ref_dist / (ref_dist + (dist - ref_dist)) -> gain = ref_dist / dist
-            gain = min(1.0, ref_dist / (dist * 0.5)) # 0.5 factor to make it drop off slower or faster
-            
-            # Boost gain slightly so it's not too quiet too fast
-            gain = max(0.1, gain) # Minimum volume 10%
-            
-            # Convert to 3D coordinates
-            # x = dist * sin(azimuth)
-            # z = -dist * cos(azimuth)
-            # Simple projection:
-            pos_x = norm_x * dist * 2.0 # Spread out horizontally
-            pos_y = norm_y * dist
-            pos_z = -dist
+            pos_x = float(positions_x[i])
+            pos_y = float(positions_y[i])
+            pos_z = float(positions_z[i])
+            gain = gains[i]
             
             # Create source if new
             if obj_id not in self.sources:
-                source_id = ctypes.c_uint(0)
-                alGenSources(1, ctypes.byref(source_id))
-                source = source_id.value
+                if self.free_sources:
+                    source = self.free_sources.pop()
+                else:
+                    # Pool exhausted - grow it by one
+                    source_id = ctypes.c_uint(0)
+                    alGenSources(1, ctypes.byref(source_id))
+                    source = source_id.value
+                    self.source_pool.append(source)
                 
                 # Set Buffer
-                sig_name = "default"
-                # Simple mapping based on label
-                if "person" in obj.label: sig_name = "person"
-                elif "door" in obj.label: sig_name = "door"
-                
-                buf = self.buffers.get(sig_name) or self.buffers.get("default")
+                buf = self._buffer_for_label(obj.label)
                 if buf:
                     alSourcei(source, AL_BUFFER, buf)
                     alSourcei(source, AL_LOOPING, AL_TRUE)
@@ -324,10 +376,15 @@ class HRTF_AudioController:
                     print(f"  🎵 Created audio source for {obj.label} (ID: {obj_id})")
                 
                 self.sources[obj_id] = source
+                self.position_buffers[obj_id] = (ctypes.c_float * 3)()
             
             # Update Source Properties
             source = self.sources[obj_id]
-            alSourcefv(source, AL_POSITION, (ctypes.c_float * 3)(pos_x, pos_y, pos_z))
+            pos_buf = self.position_buffers[obj_id]
+            pos_buf[0] = pos_x
+            pos_buf[1] = pos_y
+            pos_buf[2] = pos_z
+            alSourcefv(source, AL_POSITION, pos_buf)
             
             # Distance Attenuation
             # OpenAL handles this automatically if configured, but we can tweak gain
@@ -337,34 +394,27 @@ class HRTF_AudioController:
             # === THREAT FOCUS ===
             # If this is the main threat, keep full volume.
             # If not, duck the volume significantly.
-            
-            # Find max threat score in current set
-            max_threat = 0.0
-            for o in objects:
-                if hasattr(o, 'threat_score'):
-                    max_threat = max(max_threat, o.threat_score)
-            
-            # Apply ducking
             final_gain = base_gain
             if hasattr(obj, 'threat_score'):
                 # If this object is significantly less threatening than the max, duck it
-                if obj.threat_score < (max_threat * 0.8):
+                if obj.threat_score < duck_threshold:
                     final_gain *= 0.3 # Reduce to 30% volume
             
             alSourcef(source, AL_GAIN, final_gain)
             
             # Debug log for tuning (throttle this in production)
             # if obj_id % 10 == 0:
-            #    print(f"  🔊 {obj.label}: Dist={dist:.2f}m -> Gain={final_gain:.2f} (Threat={obj.threat_score:.2f})")
+            #    print(f"  🔊 {obj.label}: Dist={dists[i]:.2f}m -> Gain={final_gain:.2f} (Threat={obj.threat_score:.2f})")
             
-        # 2. Remove Stale Sources
+        # 3. Remove Stale Sources
         active_sources = list(self.sources.keys())
         for obj_id in active_sources:
             if obj_id not in current_ids:
-                # Stop and delete
+                # Stop and return to the pool
                 source = self.sources[obj_id]
                 alSourceStop(source)
-                source_id = ctypes.c_uint(source)
-                alDeleteSources(1, ctypes.byref(source_id))
+                alSourcei(source, AL_BUFFER, 0)
+                self.free_sources.append(source)
                 del self.sources[obj_id]
+                self.position_buffers.pop(obj_id, None)
 
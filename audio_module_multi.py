@@ -3,12 +3,92 @@ Enhanced Audio Controller with Multi-Object Support.
 Generates unique audio signatures for different object types.
 """
 
+import math
 import numpy as np
 import sounddevice as sd
 import threading
+import time
 import config
 from typing import List, Dict
 
+# Numba is optional - the mixer falls back to NumPy without it
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _mix_sources_numpy(sig_table, sig_lengths, sig_idx, positions, gains, frames, out, scratch):
+    """
+    Mix looping signatures into the stereo output buffer (NumPy fallback).
+    
+    Gathers every source's samples into one (n_sources, frames) matrix, then
+    pans and accumulates all of them with a single (2, n) @ (n, frames) matmul.
+    
+    Args:
+        sig_table: 2-D array, one tiled signature per row
+        sig_lengths: Loop length of each signature row
+        sig_idx, positions: Per-source parallel arrays (positions advanced in place)
+        gains: (n_sources, 2) left/right gain matrix
+        frames: Number of frames to mix
+        out: (2, frames) output buffer, overwritten with the mix
+        scratch: Sample matrix with at least n_sources rows of `frames` samples
+    """
+    n_sources = sig_idx.shape[0]
+    width = sig_table.shape[1]
+    samples = scratch[:n_sources]
+    for s in range(n_sources):
+        row = sig_table[sig_idx[s]]
+        length = sig_lengths[sig_idx[s]]
+        p = positions[s]
+        if p + frames <= width:
+            samples[s] = row[p:p + frames]
+        else:
+            np.take(row, np.remainder(p + np.arange(frames), length), out=samples[s])
+        positions[s] = (p + frames) % length
+    np.matmul(gains.T, samples, out=out)
+
+
+def _normalize_peak_numpy(out):
+    """Scale the stereo buffer down in place if it peaks above 1.0 (NumPy fallback)."""
+    peak = max(out.max(), -out.min())
+    inv = np.float32(1.0 / peak if peak > 1.0 else 1.0)
+    np.multiply(out, inv, out=out)
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def _mix_sources(sig_table, sig_lengths, sig_idx, positions, gains, frames, out, scratch):
+        """Fused gather + pan + accumulate kernel (same contract as the NumPy version)."""
+        out[:] = 0.0
+        for s in range(sig_idx.shape[0]):
+            k = sig_idx[s]
+            length = sig_lengths[k]
+            p = positions[s]
+            gl = gains[s, 0]
+            gr = gains[s, 1]
+            for i in range(frames):
+                v = sig_table[k, (p + i) % length]
+                out[0, i] += v * gl
+                out[1, i] += v * gr
+            positions[s] = (p + frames) % length
+
+    @njit(cache=True, fastmath=True, boundscheck=False)
+    def _normalize_peak(out):
+        """Single-pass peak reduction, then reciprocal scale if clipping."""
+        peak = 0.0
+        for i in range(out.shape[1]):
+            peak = max(peak, abs(out[0, i]), abs(out[1, i]))
+        if peak > 1.0:
+            inv = 1.0 / peak
+            for i in range(out.shape[1]):
+                out[0, i] *= inv
+                out[1, i] *= inv
+else:
+    _mix_sources = _mix_sources_numpy
+    _normalize_peak = _normalize_peak_numpy
+
 class AudioSignatureGenerator:
     """Generates unique audio waveforms for different object types."""
     
@@ -40,16 +120,17 @@ class AudioSignatureGenerator:
         elif waveform_type == "pulse":
             # Heartbeat-like pulse
             pulse_freq = frequency / 60  # Convert BPM to Hz
-            wave = np.zeros_like(t)
-            pulse_indices = (t * pulse_freq) % 1.0 < 0.1
-            wave[pulse_indices] = np.sin(2 * np.pi * 10 * t[pulse_indices])
+            pulse_phase = (t * pulse_freq) % 1.0
+            wave = np.where(pulse_phase < 0.1, np.sin(2 * np.pi * 10 * t), 0.0)
         
         else:
             wave = np.sin(2 * np.pi * frequency * t)
         
-        # Normalize
-        if wave.max() > 0:
-            wave = wave / wave.max()
+        # Normalize (sine/square/sawtooth already peak at 1.0 analytically)
+        if waveform_type == "pulse":
+            peak = wave.max()
+            if peak > 0:
+                wave = wave / peak
         
         # Apply fade in/out
         fade_samples = int(0.01 * sample_rate)
@@ -71,17 +152,35 @@ class MultiAudioController:
         self.sample_rate = config.SAMPLE_RATE
         self.buffer_size = config.AUDIO_BUFFER_SIZE
         
-        # Audio signatures cache
+        # Audio signatures cache, plus a 2-D table of tiled signatures for the mixer
         self.signatures = {}
+        self.signature_index = {}
+        self.signature_table = None
+        self.signature_lengths = None
         self._preload_signatures()
         
-        # Active audio sources: {object_id: {azimuth, volume, signature_name, position}}
+        # Active audio sources: {object_id: {azimuth, volume, signature, left_gain, right_gain}}
+        # The lock only serialises producers; the callback reads the published snapshot
         self.sources = {}
         self.sources_lock = threading.Lock()
         
+        # Immutable (ids, sig_idx, gains) snapshot swapped in whole by producers
+        self._active = ((), np.zeros(0, dtype=np.int64), np.zeros((0, 2), dtype=np.float32))
+        
+        # Playback positions are owned by the callback and follow the snapshot it last mixed
+        self._mixed = self._active
+        self._positions = np.zeros(0, dtype=np.int64)
+        
+        # Preallocated mixer buffers, reused by every callback
+        self._scratch_capacity = 0
+        self._source_capacity = 0
+        self._reserve_scratch(self.buffer_size, config.MAX_TRACKED_OBJECTS)
+        
         #Streaming
         self.stream = None
         self.running = False
+        self.shared_state = None
+        self.update_thread = None
         
         print(f"🔊 Multi-AudioController initialized | Sample Rate: {self.sample_rate} Hz")
     
@@ -98,6 +197,40 @@ class MultiAudioController:
             
             self.signatures[obj_type] = signature
             print(f"  ♪ Loaded signature: {obj_type} ({waveform_type} @ {frequency} Hz)")
+        
+        # Pack into one table; each row is tiled with a block of wrap-around
+        # padding so the mixer can usually read a contiguous slice
+        names = list(self.signatures.keys())
+        width = max(len(sig) for sig in self.signatures.values()) + self.buffer_size
+        self.signature_table = np.zeros((len(names), width), dtype=np.float32)
+        self.signature_lengths = np.zeros(len(names), dtype=np.int64)
+        for row, name in enumerate(names):
+            self.signature_table[row] = np.resize(self.signatures[name], width)
+            self.signature_lengths[row] = len(self.signatures[name])
+            self.signature_index[name] = row
+    
+    def _reserve_scratch(self, frames, n_sources):
+        """
+        Grow the preallocated mixer buffers if a callback needs more room than any before,
+        then return C-contiguous (2, frames) stereo and (capacity, frames) sample views.
+        """
+        resized = False
+        if frames > self._scratch_capacity:
+            self._scratch_capacity = frames
+            resized = True
+        
+        if n_sources > self._source_capacity:
+            self._source_capacity = n_sources
+            resized = True
+        
+        if resized:
+            # Flat storage so a shorter block still gets contiguous views (one JIT signature)
+            self._scratch_stereo = np.zeros(2 * self._scratch_capacity, dtype=np.float32)
+            self._scratch_samples = np.zeros(self._source_capacity * self._scratch_capacity, dtype=np.float32)
+        
+        stereo = self._scratch_stereo[:2 * frames].reshape(2, frames)
+        samples = self._scratch_samples[:self._source_capacity * frames].reshape(self._source_capacity, frames)
+        return stereo, samples
     
     def _audio_callback(self, outdata, frames, time_info, status):
         """
@@ -106,51 +239,42 @@ class MultiAudioController:
         if status:
             print(f"Audio stream status: {status}")
         
-        # Initialize output buffer
-        left_channel = np.zeros(frames, dtype=np.float32)
-        right_channel = np.zeros(frames, dtype=np.float32)
+        # Take the current snapshot once; no lock on the realtime thread
+        active = self._active
+        if active is not self._mixed:
+            self._adopt_snapshot(active)
+        ids, sig_idx, gains = active
         
-        # Mix all active sources
-        with self.sources_lock:
-            for obj_id, source_data in self.sources.items():
-                azimuth = source_data.get("azimuth", 0)
-                volume = source_data.get("volume", 0.5)
-                signature_name = source_data.get("signature", "default")
-                position = source_data.get("position", 0)
-                
-                # Get signature
-                signature = self.signatures.get(signature_name, self.signatures["default"])
-                
-                # Calculate stereo pan
-                pan = np.clip(azimuth / config.MAX_AZIMUTH_DEGREES, -1.0, 1.0)
-                angle = (pan + 1.0) * np.pi / 4
-                left_gain = np.cos(angle) * volume
-                right_gain = np.sin(angle) * volume
-                
-                # Sample from signature (looping)
-                samples = np.zeros(frames, dtype=np.float32)
-                n_sig_samples = len(signature)
-                
-                for i in range(frames):
-                    samples[i] = signature[position % n_sig_samples]
-                    position += 1
-                
-                # Update position for next callback
-                source_data["position"] = position
-                
-                # Mix into channels
-                left_channel += samples * left_gain
-                right_channel += samples * right_gain
+        stereo, samples = self._reserve_scratch(frames, len(ids))
+        
+        # Mix all active sources (positions advance in place)
+        _mix_sources(self.signature_table, self.signature_lengths, sig_idx, self._positions,
+                     gains, frames, stereo, samples)
         
         # Normalize to prevent clipping
-        max_val = max(np.abs(left_channel).max(), np.abs(right_channel).max())
-        if max_val > 1.0:
-            left_channel /= max_val
-            right_channel /= max_val
+        _normalize_peak(stereo)
         
-        # Output stereo
-        outdata[:, 0] = left_channel
-        outdata[:, 1] = right_channel
+        # Output interleaved int16 stereo straight into the raw device buffer
+        pcm = np.frombuffer(outdata, dtype=np.int16).reshape(frames, 2)
+        np.multiply(stereo.T, 32767, out=pcm, casting='unsafe')
+    
+    def _adopt_snapshot(self, active):
+        """Carry playback positions over by object id when a new snapshot is published."""
+        previous = dict(zip(self._mixed[0], self._positions.tolist()))
+        self._positions = np.array([previous.get(obj_id, 0) for obj_id in active[0]], dtype=np.int64)
+        self._mixed = active
+    
+    def _publish_sources(self):
+        """Rebuild the mixer snapshot from self.sources. Call with sources_lock held."""
+        default_idx = self.signature_index["default"]
+        ids = tuple(self.sources)
+        sig_idx = np.array([self.signature_index.get(src["signature"], default_idx)
+                            for src in self.sources.values()], dtype=np.int64)
+        gains = np.array([(src["left_gain"], src["right_gain"])
+                          for src in self.sources.values()], dtype=np.float32).reshape(len(ids), 2)
+        
+        # Single reference assignment, atomic under the GIL
+        self._active = (ids, sig_idx, gains)
     
     def start(self):
         """Start the audio stream."""
@@ -158,10 +282,23 @@ class MultiAudioController:
             print("⚠️ Audio stream already running.")
             return
         
+        # Trigger JIT compilation before the first realtime callback, using
+        # the same array layouts as the callback's snapshot and scratch buffers
+        if NUMBA_AVAILABLE:
+            ids, sig_idx, gains = self._active
+            stereo, samples = self._reserve_scratch(self.buffer_size, 0)
+            _mix_sources(self.signature_table, self.signature_lengths,
+                         sig_idx[:0], np.zeros(0, dtype=np.int64), gains[:0],
+                         self.buffer_size, stereo, samples)
+            _normalize_peak(stereo)
+        
         try:
-            self.stream = sd.OutputStream(
+            # Raw int16 stream: half the device bandwidth of float32 and no
+            # NumPy wrapping of the callback buffer by sounddevice
+            self.stream = sd.RawOutputStream(
                 samplerate=self.sample_rate,
                 channels=2,
+                dtype='int16',
                 blocksize=self.buffer_size,
                 callback=self._audio_callback
             )
@@ -196,26 +333,103 @@ class MultiAudioController:
             volume: Volume level 0.0-1.0
             signature_name: Audio signature type
         """
+        entry = self._source_entry(azimuth, volume, signature_name)
+        
         with self.sources_lock:
-            if obj_id not in self.sources:
-                self.sources[obj_id] = {"position": 0}
-            
-            self.sources[obj_id].update({
-                "azimuth": np.clip(azimuth, -config.MAX_AZIMUTH_DEGREES, config.MAX_AZIMUTH_DEGREES),
-                "volume": np.clip(volume, 0.0, 1.0),
-                "signature": signature_name
-            })
+            self.sources[obj_id] = entry
+            self._publish_sources()
+    
+    @staticmethod
+    def _source_entry(azimuth, volume, signature_name):
+        """Build a source dict with its stereo gains precomputed."""
+        azimuth = float(np.clip(azimuth, -config.MAX_AZIMUTH_DEGREES, config.MAX_AZIMUTH_DEGREES))
+        volume = float(np.clip(volume, 0.0, 1.0))
+        
+        # Calculate stereo pan once here instead of on every audio block
+        pan = azimuth / config.MAX_AZIMUTH_DEGREES
+        angle = (pan + 1.0) * math.pi / 4
+        
+        return {
+            "azimuth": azimuth,
+            "volume": volume,
+            "signature": signature_name,
+            # float32 so the mixer never promotes to float64 intermediates
+            "left_gain": np.float32(math.cos(angle) * volume),
+            "right_gain": np.float32(math.sin(angle) * volume)
+        }
     
     def remove_source(self, obj_id):
         """Remove an audio source."""
         with self.sources_lock:
             if obj_id in self.sources:
                 del self.sources[obj_id]
+                self._publish_sources()
     
     def clear_sources(self):
         """Clear all audio sources."""
         with self.sources_lock:
             self.sources.clear()
+            self._publish_sources()
+    
+    # === SharedGameState interface (fallback when OpenAL is unavailable) ===
+    
+    def start_stream(self, shared_state=None):
+        """Start the stream and follow tracked objects from shared state."""
+        if self.running:
+            return
+        
+        self.shared_state = shared_state
+        self.start()
+        
+        if self.running and shared_state is not None:
+            self.update_thread = threading.Thread(target=self._update_loop, daemon=True)
+            self.update_thread.start()
+    
+    def stop_stream(self):
+        """Stop the stream and drop all sources."""
+        self.stop()
+        self.clear_sources()
+    
+    def resume_stream(self):
+        """Resume if paused (re-start loop)."""
+        if not self.running:
+            self.start_stream(self.shared_state)
+    
+    def _update_loop(self):
+        """Map tracked objects onto stereo sources whenever tracking updates."""
+        while self.running:
+            try:
+                if self.shared_state.wait_for_update(timeout=0.2):
+                    display_state = self.shared_state.get_display_state()
+                    self._update_scene(display_state.get("objects", []))
+            except Exception as e:
+                print(f"⚠️ Audio loop error: {e}")
+                time.sleep(1)
+    
+    def _update_scene(self, objects):
+        """Update sources from tracked objects (azimuth from position, volume from size)."""
+        # Assuming 1280x720 frame, as in the OpenAL path
+        width = 1280
+        height = 720
+        
+        entries = {}
+        for obj in objects:
+            if not obj.bbox:
+                continue
+            
+            center_x = obj.bbox[0] + obj.bbox[2] / 2
+            azimuth = ((center_x / width) * 2 - 1) * config.MAX_AZIMUTH_DEGREES
+            area = obj.bbox[2] * obj.bbox[3]
+            volume = max(0.1, min(1.0, area / (width * height * 0.25)))
+            
+            label = obj.label.lower()
+            signature = next((name for name in self.signatures if name in label), "default")
+            entries[obj.id] = self._source_entry(azimuth, volume, signature)
+        
+        # Swap the whole scene in (stale ids dropped) and publish one snapshot
+        with self.sources_lock:
+            self.sources = entries
+            self._publish_sources()
     
     # Backward compatibility
     def update_position(self, azimuth, elevation, volume):
@@ -4,6 +4,7 @@ Includes patent-worthy features: multi-object tracking, voice control, and intel
 """
 
 import os
+import numpy as np
 
 # ============================================================================
 # GEMINI API CONFIGURATION
@@ -102,6 +103,7 @@ Just use plain, natural sentences. This will be spoken by text-to-speech.
 # ============================================================================
 CAMERA_INDICES = [ 2]  # Try these camera indices in order
 TEMP_IMAGE_FILE = "detection_frame.png"
+DETECTION_JPEG_QUALITY = 85  # Re-acquisition frames are JPEG-encoded in memory for upload
 
 # ============================================================================
 # AUDIO CONFIGURATION
@@ -282,11 +284,31 @@ PROXIMITY_ZONES = {
     "warning": {"min": 0.6, "max": 1.0, "color": (0, 0, 255)},   # <60%
 }
 
+# Zone tables in dict order for the batched zone kernel (index -> name/color)
+PROXIMITY_ZONE_NAMES = tuple(PROXIMITY_ZONES)
+PROXIMITY_ZONE_MINS = np.array([zone["min"] for zone in PROXIMITY_ZONES.values()], dtype=np.float64)
+PROXIMITY_ZONE_MAXS = np.array([zone["max"] for zone in PROXIMITY_ZONES.values()], dtype=np.float64)
+PROXIMITY_ZONE_COLORS = tuple(zone["color"] for zone in PROXIMITY_ZONES.values())
+SAFE_ZONE_INDEX = PROXIMITY_ZONE_NAMES.index("safe")
+
 # ============================================================================
 # PERFORMANCE OPTIMIZATION
 # ============================================================================
 FRAME_SKIP_DETECTION = 10  # Optimized for i3 10th gen (more frequent checks)
+
+# Adaptive skip for automatic detection: grows on static scenes, shrinks on change
+FRAME_SKIP_MAX = 30
+SCENE_DIFF_SIZE = (64, 48)  # Thumbnail used to measure inter-frame change
+SCENE_DIFF_LOW = 2.0  # Mean abs gray diff below this = static scene
+SCENE_DIFF_HIGH = 12.0  # Above this = scene changing, detect sooner
 TRACKER_CONFIDENCE_THRESHOLD = 0.5  # Re-acquire if tracker confidence drops below this
+TRACKER_BACKEND = "kcf"  # "mosse" (fastest, legacy module), "kcf", or "csrt" (most accurate, ~5x slower than KCF)
+TRACKER_WORKERS = min(4, os.cpu_count() or 1)  # Threads for per-object tracker updates; 1 = update serially
+TRACKER_SCALE = 0.5  # Trackers run on frames resized by this factor; bboxes stay in full-resolution pixels
+
+# Vision thread placement (Linux only). Threads it starts inherit the core.
+VISION_CPU_CORE = None  # e.g. 1 to pin the vision thread to core 1; None = let the OS schedule
+VISION_FIFO_PRIORITY = 0  # SCHED_FIFO priority 1-99 (needs CAP_SYS_NICE); 0 = normal scheduling
 
 # ============================================================================
 # SELF-LEARNING SYSTEM CONFIGURATION
@@ -296,6 +318,7 @@ LEARNING_DB_PATH = "assistive_learning.db"
 IMAGE_CACHE_DIR = "object_cache/"
 IMAGE_COMPRESSION_QUALITY = 50  # JPEG quality (0-100)
 MAX_CACHED_IMAGES = 1000
+LEARNING_DB_MMAP_SIZE = 64 * 1024 * 1024  # Memory-map up to 64 MB of the SQLite DB
 
 # Room mapping grid (divide frame into NxM cells)
 LEARNING_GRID_WIDTH = 10
@@ -318,6 +341,7 @@ MANUAL_FIND_KEY = 'f'  # Key to trigger manual detection
 # ============================================================================
 ENABLE_HRTF = True  # Use advanced HRTF audio instead of basic stereo
 ENABLE_ROOM_REVERB = True  # Simple room acoustics simulation
+OPENAL_SOURCE_POOL_SIZE = 32  # Sources allocated up front and recycled between objects
 
 # ============================================================================
 # ROCK 5C / ARM SBC OPTIMIZATION
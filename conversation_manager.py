@@ -1,7 +1,29 @@
+import atexit
 import json
 import os
+import threading
 import time
-from datetime import datetime
+from collections import deque
+from itertools import islice
+
+# orjson is optional: much faster (de)serialization, stdlib json otherwise
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _dumps(obj):
+    """Serialize to indented UTF-8 JSON bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+def _loads(data):
+    """Parse JSON from bytes."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
 
 class ConversationManager:
     """
@@ -12,26 +34,60 @@ class ConversationManager:
     def __init__(self, history_file="conversation_history.json", max_turns=20):
         self.history_file = history_file
         self.max_turns = max_turns
-        self.history = self._load_history()
+        # Bounded deque: appending past max_turns drops the oldest turn in O(1)
+        self.history = deque(self._load_history(), maxlen=max_turns)
+        
+        # History is written lazily by a background thread, never on the caller's turn
+        self._history_lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._dirty = False
+        self._flush_event = threading.Event()
+        self._flush_thread = threading.Thread(target=self._flush_loop, daemon=True)
+        self._flush_thread.start()
+        atexit.register(self.flush)
         
     def _load_history(self):
         """Load history from JSON file."""
         if os.path.exists(self.history_file):
             try:
-                with open(self.history_file, 'r') as f:
-                    return json.load(f)
+                with open(self.history_file, 'rb') as f:
+                    return _loads(f.read())
             except Exception as e:
                 print(f"⚠️ Failed to load history: {e}")
                 return []
         return []
     
     def save_history(self):
-        """Save history to JSON file."""
+        """Save history to JSON file (written to a temp file, then atomically replaced)."""
+        with self._history_lock:
+            snapshot = list(self.history)
+            self._dirty = False
+        
         try:
-            with open(self.history_file, 'w') as f:
-                json.dump(self.history, f, indent=2)
+            with self._write_lock:
+                tmp_file = self.history_file + ".tmp"
+                with open(tmp_file, 'wb') as f:
+                    f.write(_dumps(snapshot))
+                os.replace(tmp_file, self.history_file)
         except Exception as e:
             print(f"❌ Failed to save history: {e}")
+    
+    def flush(self):
+        """Write history now if it changed since the last save."""
+        if self._dirty:
+            self.save_history()
+    
+    def _flush_loop(self):
+        """Background writer: flush when signalled, or every couple of seconds."""
+        while True:
+            self._flush_event.wait(timeout=2.0)
+            self._flush_event.clear()
+            self.flush()
+    
+    def _mark_dirty(self):
+        """Schedule a background save."""
+        self._dirty = True
+        self._flush_event.set()
             
     def add_turn(self, role, text):
         """
@@ -40,23 +96,20 @@ class ConversationManager:
         text: The spoken text
         """
         entry = {
-            "timestamp": datetime.now().isoformat(),
+            "timestamp": time.time(),
             "role": role,
             "text": text
         }
-        self.history.append(entry)
+        with self._history_lock:
+            self.history.append(entry)
         
-        # Trim history if too long
-        if len(self.history) > self.max_turns:
-            self.history = self.history[-self.max_turns:]
-            
-        self.save_history()
+        self._mark_dirty()
         
     def get_context_string(self, limit=5):
         """
         Get recent history formatted as a string for AI prompts.
         """
-        recent = self.history[-limit:] if limit > 0 else []
+        recent = self.get_recent_history(limit)
         context = ""
         for entry in recent:
             role_name = "User" if entry["role"] == "user" else "Nova"
@@ -65,9 +118,13 @@ class ConversationManager:
 
     def get_recent_history(self, limit=5):
         """Get raw list of recent turns."""
-        return self.history[-limit:] if limit > 0 else []
+        if limit <= 0:
+            return []
+        with self._history_lock:
+            return list(islice(self.history, max(0, len(self.history) - limit), None))
 
     def clear_history(self):
         """Clear all history."""
-        self.history = []
-        self.save_history()
+        with self._history_lock:
+            self.history.clear()
+        self._mark_dirty()
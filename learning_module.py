@@ -9,21 +9,97 @@ PATENT-WORTHY INNOVATION:
 """
 
 import sqlite3
+import contextlib
 import os
+import sys
+import threading
 import time
 import cv2
 import numpy as np
 import hashlib
-from datetime import datetime
 from typing import Optional, Tuple, List, Dict
 import config
 
+# Numba is optional - the hash and grid kernels fall back to NumPy without it
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _ahash_bits_numpy(gray):
+    """Average-hash bits of a small grayscale image, one uint8 per pixel (NumPy fallback)."""
+    return (gray > gray.mean()).astype(np.uint8)
+
+
+def _bbox_to_grid_numpy(boxes, frame_width, frame_height, grid_width, grid_height):
+    """
+    Map (N, 4) float64 boxes to clamped int32 grid cells (NumPy fallback).
+    
+    Uses the same operation order and int() truncation as bbox_to_grid, so
+    cell edges agree with the scalar path.
+    """
+    grid_x = (boxes[:, 0] + boxes[:, 2] / 2) / frame_width * grid_width
+    grid_y = (boxes[:, 1] + boxes[:, 3] / 2) / frame_height * grid_height
+    grid_x = np.clip(grid_x.astype(np.int32), 0, grid_width - 1)
+    grid_y = np.clip(grid_y.astype(np.int32), 0, grid_height - 1)
+    return grid_x, grid_y
+
+
+if NUMBA_AVAILABLE:
+    # No fastmath: hash bits and cell edges must match the NumPy versions exactly
+    @njit(cache=True)
+    def _ahash_bits(gray):
+        """Mean and threshold in one kernel (same contract as the NumPy version)."""
+        flat = gray.ravel()
+        total = 0
+        for i in range(flat.shape[0]):
+            total += flat[i]
+        avg = total / flat.shape[0]
+        bits = np.empty(flat.shape[0], dtype=np.uint8)
+        for i in range(flat.shape[0]):
+            bits[i] = 1 if flat[i] > avg else 0
+        return bits
+
+    @njit(cache=True)
+    def _bbox_to_grid(boxes, frame_width, frame_height, grid_width, grid_height):
+        """Per-box loop without NumPy temporaries (same contract as the NumPy version)."""
+        n = boxes.shape[0]
+        grid_x = np.empty(n, dtype=np.int32)
+        grid_y = np.empty(n, dtype=np.int32)
+        for i in range(n):
+            gx = int((boxes[i, 0] + boxes[i, 2] / 2) / frame_width * grid_width)
+            gy = int((boxes[i, 1] + boxes[i, 3] / 2) / frame_height * grid_height)
+            grid_x[i] = max(0, min(grid_width - 1, gx))
+            grid_y[i] = max(0, min(grid_height - 1, gy))
+        return grid_x, grid_y
+else:
+    _ahash_bits = _ahash_bits_numpy
+    _bbox_to_grid = _bbox_to_grid_numpy
+
 class LearningModule:
     """
     Manages persistent learning and adaptive behavior.
     Stores object detections, learns spatial patterns, and predicts locations.
     """
     
+    # Duplicate image hashes are skipped (UNIQUE constraint) without aborting the transaction
+    _INSERT_OBJECT_SQL = """
+        INSERT OR IGNORE INTO objects (label, context, grid_x, grid_y, confidence, timestamp, last_access,
+                                       image_path, image_hash, bbox_x, bbox_y, bbox_w, bbox_h)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+    
+    _UPSERT_GRID_SQL = """
+        INSERT INTO room_grid (grid_x, grid_y, object_label, frequency, last_seen)
+        VALUES (?, ?, ?, 1, CURRENT_TIMESTAMP)
+        ON CONFLICT(grid_x, grid_y, object_label)
+        DO UPDATE SET 
+            frequency = frequency + 1,
+            last_seen = CURRENT_TIMESTAMP
+    """
+    
     def __init__(self, db_path=None, image_cache_dir=None):
         """Initialize learning module with database and image cache."""
         self.db_path = db_path or config.LEARNING_DB_PATH
@@ -34,16 +110,105 @@ class LearningModule:
         
         # Initialize database
         self.conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        # The write connection is shared across threads: one writer at a time,
+        # with transaction() nesting tracked per thread
+        self._tx_lock = threading.RLock()
+        self._tx_local = threading.local()
+        self._configure_connection()
         self._init_database()
         
+        # Running totals for get_stats, so it never has to walk the cache
+        self._cache_count = 0
+        self._cache_bytes = 0
+        self._scan_image_cache()
+        
+        # Read-only connection per reader thread; with WAL they never wait on the writer
+        self._ro_local = threading.local()
+        self._ro_conns = []
+        self._ro_lock = threading.Lock()
+        
         # Grid parameters for room mapping
         self.grid_width = config.LEARNING_GRID_WIDTH
         self.grid_height = config.LEARNING_GRID_HEIGHT
         
+        # Every cell's spoken description, computed once (flat, indexed y * width + x)
+        self._desc_lut = [sys.intern(self._compute_grid_description(x, y))
+                          for y in range(self.grid_height) for x in range(self.grid_width)]
+        
+        # Trigger JIT compilation now rather than on the first live detection
+        if NUMBA_AVAILABLE:
+            _ahash_bits(np.zeros((8, 8), dtype=np.uint8))
+            _bbox_to_grid(np.zeros((0, 4), dtype=np.float64), 1.0, 1.0, self.grid_width, self.grid_height)
+        
+        # In-memory column mirror of room_grid for predictions; reloaded when dirty
+        self._grid_dirty = True
+        self._grid_labels = None
+        self._grid_x = None
+        self._grid_y = None
+        self._grid_freq = None
+        self._grid_last_seen = None
+        
         print(f"🧠 LearningModule initialized | DB: {self.db_path}")
         print(f"   Image cache: {self.image_cache_dir}")
         print(f"   Grid: {self.grid_width}x{self.grid_height}")
     
+    @contextlib.contextmanager
+    def transaction(self):
+        """
+        Group writes into a single commit (e.g. one frame or one voice turn).
+        
+        Nested uses join the outermost transaction, so save_detection,
+        set_preference etc. commit on their own but share one commit when a
+        caller wraps several of them in `with learning.transaction():`.
+        
+        The write lock is held for the whole block, so another thread's
+        writes never land in (or get rolled back with) this transaction.
+        """
+        with self._tx_lock:
+            depth = getattr(self._tx_local, "depth", 0)
+            self._tx_local.depth = depth + 1
+            try:
+                yield self.conn
+                if depth == 0:
+                    self.conn.commit()
+            except BaseException:
+                if depth == 0:
+                    self.conn.rollback()
+                raise
+            finally:
+                self._tx_local.depth = depth
+    
+    def _ro(self):
+        """Get this thread's read-only connection (opened on first use)."""
+        conn = getattr(self._ro_local, "conn", None)
+        if conn is None:
+            if self.db_path == ":memory:":
+                return self.conn  # No second connection can see an in-memory DB
+            conn = sqlite3.connect(f"file:{self.db_path}?mode=ro", uri=True, check_same_thread=False)
+            self._ro_local.conn = conn
+            with self._ro_lock:
+                self._ro_conns.append(conn)
+        return conn
+    
+    def _scan_image_cache(self):
+        """Count cached images and their size once, using scandir's cached stat."""
+        # Only files still referenced by an objects row; eviction can never remove orphans
+        referenced = {os.path.basename(path) for (path,) in self.conn.execute(
+            "SELECT image_path FROM objects WHERE image_path IS NOT NULL")}
+        
+        with os.scandir(self.image_cache_dir) as entries:
+            for entry in entries:
+                if entry.name in referenced and entry.is_file():
+                    self._cache_count += 1
+                    self._cache_bytes += entry.stat().st_size
+    
+    def _configure_connection(self):
+        """Use WAL journaling so each detection costs one cheap commit instead of two fsyncs."""
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute("PRAGMA synchronous=NORMAL")
+        self.conn.execute("PRAGMA temp_store=MEMORY")
+        self.conn.execute(f"PRAGMA mmap_size={config.LEARNING_DB_MMAP_SIZE}")
+    
     def _init_database(self):
         """Create database tables if they don't exist."""
         cursor = self.conn.cursor()
@@ -57,7 +222,8 @@ class LearningModule:
                 grid_x INTEGER,
                 grid_y INTEGER,
                 confidence REAL,
-                timestamp DATETIME DEFAULT CURRENT_TIMESTAMP,
+                timestamp REAL DEFAULT (strftime('%s', 'now')),
+                last_access REAL DEFAULT (strftime('%s', 'now')),
                 image_path TEXT,
                 image_hash TEXT UNIQUE,
                 bbox_x INTEGER,
@@ -72,6 +238,19 @@ class LearningModule:
             cursor.execute("ALTER TABLE objects ADD COLUMN context TEXT")
         except sqlite3.OperationalError:
             pass  # Column likely already exists
+        
+        # Migration: DATETIME text timestamps (UTC) -> Unix epoch seconds
+        cursor.execute("""
+            UPDATE objects SET timestamp = CAST(strftime('%s', timestamp) AS REAL)
+            WHERE typeof(timestamp) = 'text'
+        """)
+        
+        # Migration: Add last_access column for image cache LRU (existing DBs)
+        try:
+            cursor.execute("ALTER TABLE objects ADD COLUMN last_access REAL")
+            cursor.execute("UPDATE objects SET last_access = timestamp")
+        except sqlite3.OperationalError:
+            pass  # Column likely already exists
 
         
         # User preferences table
@@ -95,6 +274,21 @@ class LearningModule:
             )
         """)
         
+        # Indexes for recall (latest sighting), prediction (most frequent cell)
+        # and image cache eviction (least recently used cached image)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_objects_label_ts
+            ON objects(label, timestamp DESC)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_grid_label_freq
+            ON room_grid(object_label, frequency DESC, last_seen DESC)
+        """)
+        cursor.execute("""
+            CREATE INDEX IF NOT EXISTS idx_objects_last_access
+            ON objects(last_access) WHERE image_path IS NOT NULL
+        """)
+        
         self.conn.commit()
         print("✅ Database tables initialized")
     
@@ -103,19 +297,20 @@ class LearningModule:
         Compute perceptual hash of image for deduplication.
         Uses average hashing (simple but effective).
         """
-        # Resize to 8x8
-        small = cv2.resize(image, (8, 8), interpolation=cv2.INTER_AREA)
+        # Resize to 8x8: cheap nearest-neighbour subsample to 64x64 first, so the
+        # area average only ever reads 4096 pixels whatever the crop size
+        small = cv2.resize(image, (64, 64), interpolation=cv2.INTER_NEAREST)
+        small = cv2.resize(small, (8, 8), interpolation=cv2.INTER_AREA)
         
         # Convert to grayscale
         gray = cv2.cvtColor(small, cv2.COLOR_BGR2GRAY) if len(small.shape) == 3 else small
         
         # Average hash
-        avg = gray.mean()
-        hash_bytes = (gray > avg).astype(np.uint8).tobytes()
+        hash_bytes = _ahash_bits(gray).tobytes()
         
         return hashlib.md5(hash_bytes).hexdigest()
     
-    def compress_and_save_image(self, frame, bbox) -> Optional[str]:
+    def compress_and_save_image(self, frame, bbox) -> Tuple[Optional[str], Optional[str]]:
         """
         Compress and save object image to cache.
         
@@ -124,7 +319,7 @@ class LearningModule:
             bbox: Bounding box (x, y, w, h)
         
         Returns:
-            Path to saved image, or None if failed
+            (path to saved image, image hash), or (None, None) if failed
         """
         try:
             x, y, w, h = map(int, bbox)
@@ -133,33 +328,47 @@ class LearningModule:
             obj_image = frame[y:y+h, x:x+w]
             
             if obj_image.size == 0:
-                return None
+                return None, None
             
-            # Resize to fixed size
-            resized = cv2.resize(obj_image, (320, 240), interpolation=cv2.INTER_AREA)
-            
-            # Compute hash
-            img_hash = self._compute_image_hash(resized)
+            # Hash the raw crop first so duplicates skip the resize and JPEG encode
+            img_hash = self._compute_image_hash(obj_image)
             
             # Check if already exists
-            cursor = self.conn.cursor()
-            cursor.execute("SELECT image_path FROM objects WHERE image_hash = ?", (img_hash,))
-            existing = cursor.fetchone()
+            with self.transaction():
+                cursor = self.conn.cursor()
+                cursor.execute("SELECT image_path FROM objects WHERE image_hash = ?", (img_hash,))
+                existing = cursor.fetchone()
+                
+                if existing:
+                    # Already cached - mark as recently used for eviction
+                    cursor.execute("UPDATE objects SET last_access = ? WHERE image_hash = ?", (time.time(), img_hash))
             
             if existing:
-                return existing[0]  # Already cached
+                return existing[0], img_hash
+            
+            # Resize to fixed size
+            resized = cv2.resize(obj_image, (320, 240), interpolation=cv2.INTER_AREA)
+            
+            # Encode as JPEG with compression; the buffer length is the file size
+            ok, encoded = cv2.imencode('.jpg', resized, [cv2.IMWRITE_JPEG_QUALITY, config.IMAGE_COMPRESSION_QUALITY])
+            if not ok:
+                return None, img_hash
             
-            # Save as JPEG with compression
             filename = f"{img_hash}.jpg"
             filepath = os.path.join(self.image_cache_dir, filename)
             
-            cv2.imwrite(filepath, resized, [cv2.IMWRITE_JPEG_QUALITY, config.IMAGE_COMPRESSION_QUALITY])
+            is_new = not os.path.exists(filepath)
+            with open(filepath, 'wb') as f:
+                f.write(encoded)
+            if is_new:
+                self._cache_count += 1
+                self._cache_bytes += len(encoded)
             
-            return filepath
+            return filepath, img_hash
         
         except Exception as e:
             print(f"❌ Failed to save image: {e}")
-            return None
+            return None, None
     
     def bbox_to_grid(self, bbox, frame_width, frame_height) -> Tuple[int, int]:
         """Convert bounding box to grid coordinates."""
@@ -176,6 +385,32 @@ class LearningModule:
         
         return (grid_x, grid_y)
     
+    def bbox_to_grid_batch(self, bboxes, frame_width, frame_height) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Convert N bounding boxes to grid coordinates in one pass.
+        
+        Args:
+            bboxes: (N, 4) array-like of (x, y, w, h)
+            frame_width, frame_height: Frame dimensions
+        
+        Returns:
+            (grid_x, grid_y) int32 arrays of length N
+        """
+        boxes = np.ascontiguousarray(bboxes, dtype=np.float64).reshape(-1, 4)
+        return _bbox_to_grid(boxes, float(frame_width), float(frame_height),
+                             self.grid_width, self.grid_height)
+    
+    def _detection_rows(self, frame, label, bbox, confidence, grid_x, grid_y, context=None):
+        """Build the objects and room_grid rows for one detection (image is cached as a side effect)."""
+        # Save compressed image (hashed once, reused for the row)
+        image_path, image_hash = self.compress_and_save_image(frame, bbox)
+        
+        now = time.time()
+        object_row = (label, context, grid_x, grid_y, confidence, now, now, image_path, image_hash,
+                      int(bbox[0]), int(bbox[1]), int(bbox[2]), int(bbox[3]))
+        grid_row = (grid_x, grid_y, label)
+        return object_row, grid_row
+    
     def save_detection(self, frame, label, bbox, confidence, frame_width, frame_height, context=None):
         """
         Save object detection to database and cache.
@@ -189,51 +424,107 @@ class LearningModule:
             context: Semantic context (e.g., "on table")
         """
         try:
-            # Convert to grid coordinates
             grid_x, grid_y = self.bbox_to_grid(bbox, frame_width, frame_height)
+            object_row, grid_row = self._detection_rows(frame, label, bbox, confidence,
+                                                        grid_x, grid_y, context)
             
-            # Save compressed image
-            image_path = self.compress_and_save_image(frame, bbox)
-            image_hash = self._compute_image_hash(frame[int(bbox[1]):int(bbox[1]+bbox[3]), 
-                                                          int(bbox[0]):int(bbox[0]+bbox[2])])
-            
-            # Insert into objects table
-            cursor = self.conn.cursor()
-            try:
-                cursor.execute("""
-                    INSERT INTO objects (label, context, grid_x, grid_y, confidence, image_path, image_hash, 
-                                       bbox_x, bbox_y, bbox_w, bbox_h)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """, (label, context, grid_x, grid_y, confidence, image_path, image_hash,
-                      int(bbox[0]), int(bbox[1]), int(bbox[2]), int(bbox[3])))
-                
-                self.conn.commit()
-            except sqlite3.IntegrityError:
-                # Duplicate image hash - already saved
-                pass
-            
-            # Update room grid frequency
-            self._update_room_grid(label, grid_x, grid_y)
+            # Object row and room grid frequency in one transaction
+            with self.transaction():
+                self.conn.execute(self._INSERT_OBJECT_SQL, object_row)
+                self._update_room_grid(label, grid_row[0], grid_row[1])
+            self._evict_if_needed()
             
-            print(f"💾 Saved: {label} at grid({grid_x},{grid_y}) conf={confidence:.2f}")
+            print(f"💾 Saved: {label} at grid({grid_row[0]},{grid_row[1]}) conf={confidence:.2f}")
         
         except Exception as e:
             print(f"❌ Failed to save detection: {e}")
     
-    def _update_room_grid(self, label, grid_x, grid_y):
-        """Update room grid frequency map."""
-        cursor = self.conn.cursor()
+    def save_detections_batch(self, frame, detections, frame_width, frame_height):
+        """
+        Save several detections from the same frame with a single commit.
         
-        cursor.execute("""
-            INSERT INTO room_grid (grid_x, grid_y, object_label, frequency, last_seen)
-            VALUES (?, ?, ?, 1, CURRENT_TIMESTAMP)
-            ON CONFLICT(grid_x, grid_y, object_label)
-            DO UPDATE SET 
-                frequency = frequency + 1,
-                last_seen = CURRENT_TIMESTAMP
-        """, (grid_x, grid_y, label))
+        Args:
+            frame: Video frame
+            detections: List of (label, bbox, confidence, context) tuples
+            frame_width, frame_height: Frame dimensions
+        """
+        try:
+            if not detections:
+                return
+            
+            # Grid cells for every detection at once
+            grid_xs, grid_ys = self.bbox_to_grid_batch([det[1] for det in detections],
+                                                       frame_width, frame_height)
+            
+            object_rows = []
+            grid_rows = []
+            for (label, bbox, confidence, context), grid_x, grid_y in zip(detections, grid_xs.tolist(), grid_ys.tolist()):
+                object_row, grid_row = self._detection_rows(frame, label, bbox, confidence,
+                                                            grid_x, grid_y, context)
+                object_rows.append(object_row)
+                grid_rows.append(grid_row)
+            
+            with self.transaction():
+                self.conn.executemany(self._INSERT_OBJECT_SQL, object_rows)
+                self.conn.executemany(self._UPSERT_GRID_SQL, grid_rows)
+            self._grid_dirty = True
+            self._evict_if_needed()
+            
+            print(f"💾 Saved {len(object_rows)} detections")
         
-        self.conn.commit()
+        except Exception as e:
+            print(f"❌ Failed to save detections: {e}")
+    
+    def _evict_if_needed(self, target=None):
+        """Delete least recently used cached images (and their rows) beyond the cache limit."""
+        target = config.MAX_CACHED_IMAGES if target is None else target
+        excess = self._cache_count - target
+        if excess <= 0:
+            return
+        
+        with self.transaction():
+            victims = self.conn.execute("""
+                SELECT id, image_path FROM objects
+                WHERE image_path IS NOT NULL
+                ORDER BY last_access ASC
+                LIMIT ?
+            """, (excess,)).fetchall()
+            self.conn.executemany("DELETE FROM objects WHERE id = ?", [(row_id,) for row_id, _ in victims])
+        
+        # The rows are gone, so every victim leaves the count even if its file already is
+        self._cache_count -= len(victims)
+        for _, image_path in victims:
+            try:
+                size = os.path.getsize(image_path)
+            except OSError:
+                continue
+            self._cache_bytes -= size
+            try:
+                os.unlink(image_path)
+            except OSError:
+                pass
+        
+        print(f"🧹 Evicted {len(victims)} cached images")
+    
+    def _update_room_grid(self, label, grid_x, grid_y):
+        """Update room grid frequency map (caller commits)."""
+        self.conn.execute(self._UPSERT_GRID_SQL, (grid_x, grid_y, label))
+        self._grid_dirty = True
+    
+    def _load_grid_cache(self):
+        """Reload the room_grid column arrays used by get_likely_location."""
+        rows = self.conn.execute("""
+            SELECT object_label, grid_x, grid_y, frequency, CAST(strftime('%s', last_seen) AS INTEGER)
+            FROM room_grid
+        """).fetchall()
+        
+        labels, gx, gy, freq, last_seen = zip(*rows) if rows else ((), (), (), (), ())
+        self._grid_labels = np.array(labels, dtype=object)
+        self._grid_x = np.array(gx, dtype=np.int32)
+        self._grid_y = np.array(gy, dtype=np.int32)
+        self._grid_freq = np.array(freq, dtype=np.int32)
+        self._grid_last_seen = np.array(last_seen, dtype=np.int64)
+        self._grid_dirty = False
     
     def get_likely_location(self, label) -> Optional[Tuple[int, int, float]]:
         """
@@ -245,32 +536,21 @@ class LearningModule:
         Returns:
             (grid_x, grid_y, probability) or None if no history
         """
-        cursor = self.conn.cursor()
-        
-        # Get total frequency for this object
-        cursor.execute("""
-            SELECT SUM(frequency) FROM room_grid WHERE object_label = ?
-        """, (label,))
-        total = cursor.fetchone()[0]
-        
-        if not total or total == 0:
-            return None
+        if self._grid_dirty:
+            self._load_grid_cache()
         
-        # Get most frequent location
-        cursor.execute("""
-            SELECT grid_x, grid_y, frequency, last_seen
-            FROM room_grid
-            WHERE object_label = ?
-            ORDER BY frequency DESC, last_seen DESC
-            LIMIT 1
-        """, (label,))
+        mask = self._grid_labels == label
+        freqs = self._grid_freq[mask]
+        total = freqs.sum(dtype=np.int64)
         
-        result = cursor.fetchone()
-        if not result:
+        if not total:
             return None
         
-        grid_x, grid_y, freq, last_seen = result
-        probability = freq / total
+        # Most frequent cell, most recent sighting breaking ties
+        best = np.lexsort((self._grid_last_seen[mask], freqs))[-1]
+        grid_x = int(self._grid_x[mask][best])
+        grid_y = int(self._grid_y[mask][best])
+        probability = float(freqs[best] / total)
         
         print(f"🎯 Prediction: {label} likely at grid({grid_x},{grid_y}) | prob={probability:.1%}")
         
@@ -300,26 +580,25 @@ class LearningModule:
         return (int(x_min), int(y_min), int(x_max - x_min), int(y_max - y_min))
     
     def set_preference(self, key, value):
-        """Save user preference."""
-        cursor = self.conn.cursor()
-        cursor.execute("""
-            INSERT INTO user_preferences (key, value, updated_at)
-            VALUES (?, ?, CURRENT_TIMESTAMP)
-            ON CONFLICT(key)
-            DO UPDATE SET value = ?, updated_at = CURRENT_TIMESTAMP
-        """, (key, value, value))
-        self.conn.commit()
+        """Save user preference (commits with the enclosing transaction, if any)."""
+        with self.transaction():
+            self.conn.execute("""
+                INSERT INTO user_preferences (key, value, updated_at)
+                VALUES (?, ?, CURRENT_TIMESTAMP)
+                ON CONFLICT(key)
+                DO UPDATE SET value = ?, updated_at = CURRENT_TIMESTAMP
+            """, (key, value, value))
     
     def get_preference(self, key, default=None):
         """Get user preference."""
-        cursor = self.conn.cursor()
+        cursor = self._ro().cursor()
         cursor.execute("SELECT value FROM user_preferences WHERE key = ?", (key,))
         result = cursor.fetchone()
         return result[0] if result else default
     
     def get_stats(self) -> Dict:
         """Get learning statistics."""
-        cursor = self.conn.cursor()
+        cursor = self._ro().cursor()
         
         cursor.execute("SELECT COUNT(*) FROM objects")
         total_detections = cursor.fetchone()[0]
@@ -330,23 +609,25 @@ class LearningModule:
         cursor.execute("SELECT COUNT(*) FROM room_grid")
         grid_cells = cursor.fetchone()[0]
         
-        # Calculate cache size
-        cache_size = sum(os.path.getsize(os.path.join(self.image_cache_dir, f)) 
-                        for f in os.listdir(self.image_cache_dir) 
-                        if f.endswith('.jpg'))
-        
         return {
             "total_detections": total_detections,
             "unique_labels": unique_labels,
             "grid_cells_mapped": grid_cells,
-            "cache_size_mb": cache_size / (1024 * 1024),
-            "cached_images": len([f for f in os.listdir(self.image_cache_dir) if f.endswith('.jpg')])
+            "cache_size_mb": self._cache_bytes / (1024 * 1024),
+            "cached_images": self._cache_count
         }
     
     def close(self):
-        """Close database connection."""
+        """Close database connections."""
+        with self._ro_lock:
+            for conn in self._ro_conns:
+                conn.close()
+            self._ro_conns.clear()
+        self._ro_local = threading.local()
+        
         if self.conn:
-            self.conn.close()
+            with self._tx_lock:
+                self.conn.close()
             print("🔒 Learning database closed")
     
     # === MEMORY RECALL FEATURE (CINEMATIC!) ===
@@ -361,10 +642,11 @@ class LearningModule:
         Returns:
             Dict with location info or None if never seen
         """
-        cursor = self.conn.cursor()
+        cursor = self._ro().cursor()
         
         cursor.execute("""
-            SELECT label, context, grid_x, grid_y, timestamp, confidence
+            SELECT label, context, grid_x, grid_y, timestamp, confidence,
+                   MAX(0, CAST((julianday('now') - 2440587.5) * 86400.0 - timestamp AS INTEGER)) AS age_s
             FROM objects
             WHERE label = ?
             ORDER BY timestamp DESC
@@ -375,23 +657,17 @@ class LearningModule:
         if not result:
             return None
         
-        label, context, grid_x, grid_y, timestamp, confidence = result
-        
-        # Calculate time ago
-        from datetime import datetime
-        then = datetime.fromisoformat(timestamp)
-        now = datetime.now()
-        delta = now - then
-        
-        # Human-readable time
-        if delta.total_seconds() < 60:
-            time_ago = f"{int(delta.total_seconds())} seconds ago"
-        elif delta.total_seconds() < 3600:
-            time_ago = f"{int(delta.total_seconds() / 60)} minutes ago"
-        elif delta.total_seconds() < 86400:
-            time_ago = f"{int(delta.total_seconds() / 3600)} hours ago"
+        label, context, grid_x, grid_y, timestamp, confidence, age_s = result
+        
+        # Human-readable time (age in whole seconds comes from SQL)
+        if age_s < 60:
+            time_ago = f"{age_s} seconds ago"
+        elif age_s < 3600:
+            time_ago = f"{age_s // 60} minutes ago"
+        elif age_s < 86400:
+            time_ago = f"{age_s // 3600} hours ago"
         else:
-            time_ago = f"{int(delta.total_seconds() / 86400)} days ago"
+            time_ago = f"{age_s // 86400} days ago"
         
         # Get location description
         location_desc = self._grid_to_description(grid_x, grid_y)
@@ -413,6 +689,14 @@ class LearningModule:
     
     def _grid_to_description(self, grid_x, grid_y) -> str:
         """Convert grid coordinates to human-readable location."""
+        if 0 <= grid_x < self.grid_width and 0 <= grid_y < self.grid_height:
+            return self._desc_lut[grid_y * self.grid_width + grid_x]
+        
+        # Rows recorded under a different grid size
+        return self._compute_grid_description(grid_x, grid_y)
+    
+    def _compute_grid_description(self, grid_x, grid_y) -> str:
+        """Describe a grid cell by its third of the view horizontally and vertically."""
         # Horizontal position
         if grid_x < self.grid_width / 3:
             h_pos = "left side"
@@ -16,21 +16,44 @@ import json
 import re
 import os
 
-def draw_enhanced_overlay(frame, mode_controller, tracking_status):
-    """
-    Draw comprehensive debug overlay with multi-object visualization.
+def _draw_radar_background(img, radar_center, radar_radius):
+    """Draw the radar disc, border, and crosshairs."""
+    cv2.circle(img, radar_center, radar_radius, config.COLOR_OVERLAY_BG, -1)
+    cv2.circle(img, radar_center, radar_radius, config.COLOR_TEXT, 2)
     
-    Args:
-        frame: Video frame
-        mode_controller: ModeController instance
-        tracking_status: "TRACKING", "LOST", or "SEARCHING"
+    # Draw crosshairs
+    cv2.line(img, (radar_center[0] - radar_radius, radar_center[1]),
+             (radar_center[0] + radar_radius, radar_center[1]), config.COLOR_TEXT, 1)
+    cv2.line(img, (radar_center[0], radar_center[1] - radar_radius),
+             (radar_center[0], radar_center[1] + radar_radius), config.COLOR_TEXT, 1)
+
+
+def _build_radar_tile(radar_size):
     """
-    height, width = frame.shape[:2]
+    Render the static radar background once.
     
-    # === TOP STATUS BAR ===
-    status_height = 120
-    status_bar = np.zeros((status_height, width, 3), dtype=np.uint8)
-    status_bar[:] = config.COLOR_OVERLAY_BG
+    Returns:
+        (tile, mask): BGR tile and uint8 mask of the pixels it covers
+    """
+    center = (radar_size // 2, radar_size // 2)
+    tiles = []
+    for fill in (0, 255):
+        tile = np.full((radar_size, radar_size, 3), fill, dtype=np.uint8)
+        _draw_radar_background(tile, center, radar_size // 2 - 10)
+        tiles.append(tile)
+    # Pixels that come out the same on black and white are fully covered
+    mask = (tiles[0] == tiles[1]).all(axis=2).astype(np.uint8)
+    return tiles[0], mask
+
+
+RADAR_SIZE = 150
+RADAR_TILE, RADAR_TILE_MASK = _build_radar_tile(RADAR_SIZE)
+
+
+def _draw_status_bar(img, tracking_status, mode_desc, obj_count):
+    """Draw the top status bar (status, mode, object count, controls hint) over the whole image."""
+    width = img.shape[1]
+    cv2.rectangle(img, (0, 0), (width - 1, img.shape[0] - 1), config.COLOR_OVERLAY_BG, -1)
     
     # Status indicator with better messaging
     if tracking_status == "TRACKING":
@@ -43,92 +66,114 @@ def draw_enhanced_overlay(frame, mode_controller, tracking_status):
         status_color = config.COLOR_LOST
         status_label = "○ Ready"
     
-    cv2.putText(status_bar, f"Status: {status_label}", (20, 30),
+    cv2.putText(img, f"Status: {status_label}", (20, 30),
                 config.FONT, 0.8, status_color, 2)
     
     # Mode info
-    mode_desc = mode_controller.get_mode_description()
-    cv2.putText(status_bar, f"Mode: {mode_desc}", (20, 60),
+    cv2.putText(img, f"Mode: {mode_desc}", (20, 60),
                 config.FONT, 0.6, config.COLOR_TEXT, 1)
     
     # Object count
-    obj_count = len(mode_controller.object_manager.objects)
-    cv2.putText(status_bar, f"Objects: {obj_count}", (20, 90),
+    cv2.putText(img, f"Objects: {obj_count}", (20, 90),
                 config.FONT, 0.6, config.COLOR_TEXT, 1)
     
     # Controls hint
-    cv2.putText(status_bar, "V:Voice | D:Describe | M:Mode | Q:Quit", (width - 500, 30),
+    cv2.putText(img, "V:Voice | D:Describe | M:Mode | Q:Quit", (width - 500, 30),
                 config.FONT, 0.5, (200, 200, 200), 1)
+
+
+# Last rendered status bar: [key, pixels]
+_status_bar_cache = [None, None]
+
+
+def draw_enhanced_overlay(frame, mode_controller, tracking_status, snapshot=None):
+    """
+    Draw comprehensive debug overlay with multi-object visualization.
+    
+    Args:
+        frame: Video frame
+        mode_controller: ModeController instance
+        tracking_status: "TRACKING", "LOST", or "SEARCHING"
+        snapshot: ObjectSnapshot to draw (defaults to the mode controller's objects)
+    """
+    height, width = frame.shape[:2]
+    if snapshot is None:
+        snapshot = mode_controller.object_manager.snapshot()
     
-    # Apply status bar
-    frame[0:status_height, :] = status_bar
+    # === TOP STATUS BAR ===
+    # Re-rendered only when its text changes; otherwise the cached pixels are copied in
+    status_height = 120
+    mode_desc = mode_controller.get_mode_description()
+    obj_count = snapshot.object_count
+    bar_key = (width, frame.shape[2:], frame.dtype, tracking_status, mode_desc, obj_count)
+    if _status_bar_cache[0] != bar_key:
+        bar = np.empty((status_height, width) + frame.shape[2:], dtype=frame.dtype)
+        _draw_status_bar(bar, tracking_status, mode_desc, obj_count)
+        _status_bar_cache[:] = [bar_key, bar]
+    frame[:status_height] = _status_bar_cache[1][:height]
     
     # === DRAW OBJECT BOUNDING BOXES ===
-    for obj in mode_controller.object_manager.objects:
-        if obj.bbox:
-            x, y, w, h = map(int, obj.bbox)
-            
-            # Determine color based on proximity zone
-            zone = mode_controller.object_manager.get_proximity_zone(obj, width, height)
-            zone_color = config.PROXIMITY_ZONES[zone]["color"]
-            
-            # Draw bounding box
-            cv2.rectangle(frame, (x, y), (x + w, y + h), obj.color, 3)
-            
-            # Draw label
-            label_text = f"#{obj.id} {obj.label}"
-            cv2.putText(frame, label_text, (x, y - 10),
-                        config.FONT, 0.6, obj.color, 2)
-            
-            # Draw proximity indicator
-            cv2.circle(frame, (x + w - 20, y + 20), 10, zone_color, -1)
-            
-            # Draw predicted position if available
-            if obj.predicted_bbox and config.MOTION_PREDICTION_ENABLED:
-                px, py, pw, ph = map(int, obj.predicted_bbox)
-                cv2.rectangle(frame, (px, py), (px + pw, py + ph), obj.color, 1, cv2.LINE_4)
-                cv2.line(frame, (x + w//2, y + h//2), (px + pw//2, py + ph//2),
-                        obj.color, 2, cv2.LINE_AA)
+    # Proximity zones for all objects in one kernel call
+    zones = mode_controller.object_manager.get_proximity_zones(snapshot.bboxes, width, height).tolist()
+    boxes = snapshot.bboxes.astype(np.int64).tolist()
+    predicted_boxes = snapshot.predicted_bboxes.astype(np.int64).tolist()
+    show_prediction = snapshot.has_pred.tolist() if config.MOTION_PREDICTION_ENABLED else [False] * len(snapshot)
+    ids = snapshot.ids.tolist()
+    
+    for i in range(len(snapshot)):
+        x, y, w, h = boxes[i]
+        color = snapshot.colors[i]
+        
+        # Determine color based on proximity zone
+        zone_color = config.PROXIMITY_ZONE_COLORS[zones[i]]
+        
+        # Draw bounding box
+        cv2.rectangle(frame, (x, y), (x + w, y + h), color, 3)
+        
+        # Draw label
+        label_text = f"#{ids[i]} {snapshot.labels[i]}"
+        cv2.putText(frame, label_text, (x, y - 10),
+                    config.FONT, 0.6, color, 2)
+        
+        # Draw proximity indicator
+        cv2.circle(frame, (x + w - 20, y + 20), 10, zone_color, -1)
+        
+        # Draw predicted position if available
+        if show_prediction[i]:
+            px, py, pw, ph = predicted_boxes[i]
+            cv2.rectangle(frame, (px, py), (px + pw, py + ph), color, 1, cv2.LINE_4)
+            cv2.line(frame, (x + w//2, y + h//2), (px + pw//2, py + ph//2),
+                    color, 2, cv2.LINE_AA)
     
     # === RADAR DISPLAY ===
-    radar_size = 150
+    radar_size = RADAR_SIZE
     radar_x = width - radar_size - 20
     radar_y = height - radar_size - 20
     radar_center = (radar_x + radar_size // 2, radar_y + radar_size // 2)
     radar_radius = radar_size // 2 - 10
     
-    # Draw radar background
-    cv2.circle(frame, radar_center, radar_radius, config.COLOR_OVERLAY_BG, -1)
-    cv2.circle(frame, radar_center, radar_radius, config.COLOR_TEXT, 2)
-    
-    # Draw crosshairs
-    cv2.line(frame, (radar_center[0] - radar_radius, radar_center[1]),
-             (radar_center[0] + radar_radius, radar_center[1]), config.COLOR_TEXT, 1)
-    cv2.line(frame, (radar_center[0], radar_center[1] - radar_radius),
-             (radar_center[0], radar_center[1] + radar_radius), config.COLOR_TEXT, 1)
+    # Draw radar background (pre-rendered tile unless the frame clips it)
+    if radar_x >= 0 and radar_y >= 0:
+        cv2.copyTo(RADAR_TILE, RADAR_TILE_MASK,
+                   frame[radar_y:radar_y + radar_size, radar_x:radar_x + radar_size])
+    else:
+        _draw_radar_background(frame, radar_center, radar_radius)
     
     # Plot objects on radar
-    for obj in mode_controller.object_manager.objects:
-        if obj.bbox:
-            # Calculate azimuth and elevation from bbox
-            box_center_x = obj.bbox[0] + obj.bbox[2] / 2
-            normalized_x = (box_center_x / width) * 2 - 1
-            azimuth = normalized_x * config.MAX_AZIMUTH_DEGREES
-            
-            box_center_y = obj.bbox[1] + obj.bbox[3] / 2
-            normalized_y = 1 - (box_center_y / height) * 2
-            elevation = normalized_y * config.MAX_ELEVATION_DEGREES
-            
-            # Map to radar
-            azimuth_norm = np.clip(azimuth / config.MAX_AZIMUTH_DEGREES, -1, 1)
-            elevation_norm = np.clip(elevation / config.MAX_ELEVATION_DEGREES, -1, 1)
-            
-            indicator_x = int(radar_center[0] + azimuth_norm * radar_radius * 0.8)
-            indicator_y = int(radar_center[1] - elevation_norm * radar_radius * 0.8)
-            
-            # Draw indicator
-            indicator_radius = 6
-            cv2.circle(frame, (indicator_x, indicator_y), indicator_radius, obj.color, -1)
+    if len(snapshot):
+        # Normalized azimuth/elevation (-1..1) from bbox centers, all objects at once
+        bboxes = snapshot.bboxes.astype(np.float32)
+        azimuth_norm = np.clip((bboxes[:, 0] + bboxes[:, 2] * 0.5) / width * 2 - 1, -1, 1)
+        elevation_norm = np.clip(1 - (bboxes[:, 1] + bboxes[:, 3] * 0.5) / height * 2, -1, 1)
+        
+        # Map to radar
+        indicator_xs = (radar_center[0] + azimuth_norm * (radar_radius * 0.8)).astype(np.int32).tolist()
+        indicator_ys = (radar_center[1] - elevation_norm * (radar_radius * 0.8)).astype(np.int32).tolist()
+        
+        # Draw indicators
+        indicator_radius = 6
+        for color, indicator_x, indicator_y in zip(snapshot.colors, indicator_xs, indicator_ys):
+            cv2.circle(frame, (indicator_x, indicator_y), indicator_radius, color, -1)
             cv2.circle(frame, (indicator_x, indicator_y), indicator_radius + 1, config.COLOR_TEXT, 1)
     
     # Radar label
@@ -141,6 +186,46 @@ def draw_enhanced_overlay(frame, mode_controller, tracking_status):
     return frame
 
 
+def pin_current_thread(cpu_core=None, fifo_priority=0):
+    """
+    Pin the calling thread to one CPU core and optionally run it SCHED_FIFO.
+    Linux only; failures (other OS, missing CAP_SYS_NICE) are reported and ignored.
+    """
+    if cpu_core is not None:
+        try:
+            os.sched_setaffinity(0, {cpu_core})
+            print(f"📌 Thread pinned to CPU {cpu_core}")
+        except (AttributeError, OSError) as e:
+            print(f"⚠️ Could not pin thread to CPU {cpu_core}: {e}")
+    
+    if fifo_priority:
+        try:
+            os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(fifo_priority))
+            print(f"⏱️ Thread running SCHED_FIFO (priority {fifo_priority})")
+        except (AttributeError, OSError) as e:
+            print(f"⚠️ Could not set SCHED_FIFO priority {fifo_priority}: {e}")
+
+
+# pollKey (OpenCV >= 4.5) pumps window events without waitKey's sleep
+_poll_window_key = cv2.pollKey if hasattr(cv2, "pollKey") else (lambda: cv2.waitKey(1))
+
+
+def read_key(console):
+    """
+    Poll the window and the terminal once each.
+    
+    Returns:
+        Lowercase key character, or None (terminal input wins if both)
+    """
+    window_key = _poll_window_key()
+    term_key = console.get_key()
+    if term_key:
+        return term_key.lower()
+    if window_key != -1:
+        return chr(window_key & 0xFF).lower()
+    return None
+
+
 class NonBlockingConsole:
     """
     Enables non-blocking terminal input for controlling the app without window focus.
@@ -210,10 +295,13 @@ def main():
             
             print("[2/5] Initializing HRTF Audio Controller...")
             if config.ENABLE_HRTF:
-                from audio_hrtf import HRTF_AudioController
-                audio_controller = HRTF_AudioController()
-            else:
-                from audio_module_multi import MultiAudioController
+                # OpenAL Soft does the mixing and HRTF convolution natively
+                import audio_hrtf
+                audio_controller = audio_hrtf.HRTF_AudioController()
+                if not audio_hrtf.OPENAL_AVAILABLE:
+                    print("⚠️ Falling back to software stereo mixer")
+                    audio_controller = None
+            if audio_controller is None:
                 audio_controller = MultiAudioController()
             print()
             print("[3/5] Initializing Voice Controller...")
@@ -279,12 +367,25 @@ def main():
             # Vision Thread Function
             def vision_worker():
                 print("👀 Vision thread started")
+                if config.VISION_CPU_CORE is not None or config.VISION_FIFO_PRIORITY:
+                    pin_current_thread(config.VISION_CPU_CORE, config.VISION_FIFO_PRIORITY)
                 
+                next_tick = 0.0
                 while shared_state.is_running:
+                    # === VISION UPDATE FREQUENCY ===
+                    # Vision runs slower than UI to save CPU: at most 20 FPS,
+                    # and each tick starts as soon as a new frame is published
+                    delay = next_tick - time.monotonic()
+                    if delay > 0:
+                        time.sleep(delay)
+                    if not shared_state.wait_for_frame(timeout=0.05):
+                        continue
+                    now = time.monotonic()  # One clock read per tick, shared by every check below
+                    next_tick = now + 0.05
+                    
                     # 1. Get latest frame
                     frame = shared_state.get_latest_frame()
                     if frame is None:
-                        time.sleep(0.01)
                         continue
                         
                     # 2. Check for Async Detection Results (Non-blocking)
@@ -303,14 +404,13 @@ def main():
                             
                             # Save to learning database
                             if learning_module:
-                                for obj in mode_controller.object_manager.objects:
-                                    if obj.bbox:
-                                        learning_module.save_detection(
-                                            frame, obj.label, obj.bbox, obj.confidence,
-                                            vision_controller.frame_width,
-                                            vision_controller.frame_height,
-                                            context=obj.context
-                                        )
+                                learning_module.save_detections_batch(
+                                    frame,
+                                    [(obj.label, obj.bbox, obj.confidence, obj.context)
+                                     for obj in mode_controller.object_manager.objects if obj.bbox],
+                                    vision_controller.frame_width,
+                                    vision_controller.frame_height
+                                )
                             
                             # We can't easily check if this was a "manual" detect command here since it's async
                             # But we can check if we should speak based on recent commands or state
@@ -321,6 +421,10 @@ def main():
                     command = shared_state.get_next_command()
                     should_detect = (command == "detect")
                     
+                    # Automatic re-acquisition (non-manual mode) on an adaptive frame skip
+                    if config.AUTO_REACQUISITION_ENABLED and vision_controller.should_auto_detect(frame):
+                        should_detect = True
+                    
                     if should_detect:
                         if not vision_controller.is_searching:
                             print("\n🧠 Vision Thread: Starting ASYNC detection...")
@@ -343,7 +447,7 @@ def main():
                     # Only track if we have objects
                     if mode_controller.object_manager.objects:
                         # Update trackers
-                        mode_controller.object_manager.update_trackers(frame)
+                        mode_controller.object_manager.update_trackers(frame, now)
                         
                         # Update shared state so audio thread can generate sounds
                         objects = mode_controller.object_manager.objects
@@ -369,23 +473,19 @@ def main():
                                 
                         # Update template if tracking is good (every 1s roughly)
                         elif not obj.is_lost and obj.tracker:
-                            if time.time() - obj.last_template_update > 1.0:
+                            if now - obj.last_template_update > 1.0:
                                 mode_controller.object_manager.update_template(obj, frame)
 
                     # Check for stale trackers (30s timeout)
-                    if mode_controller.object_manager.cleanup_stale_trackers(max_age=30.0):
+                    if mode_controller.object_manager.cleanup_stale_trackers(max_age=30.0, now=now):
                         print("🔄 Stale trackers removed. Triggering re-scan.")
                         shared_state.add_command("detect")
 
-                    if mode_controller.check_lost_threats():
+                    if mode_controller.check_lost_threats(now):
                         print("⚠️ Critical threat lost! Forcing re-scan...")
                         shared_state.add_command("detect")
                         if voice_enabled:
                             voice_controller.speak("Lost track. Rescanning.", async_mode=True)
-                        
-                    # === VISION UPDATE FREQUENCY ===
-                    # Vision runs slower than UI to save CPU
-                    time.sleep(0.05) # 20 FPS for vision processing
                 
                 print("👁️ Vision thread stopped")
         
@@ -396,6 +496,8 @@ def main():
             print("\n🚀 System is live! Press 'Q' to quit.")
             
             # === Main Application Loop (Video/UI Only) ===
+            # Overlay canvas, reused every frame (UI thread only)
+            display_frame = None
             try:
                 while True:
                     if not shared_state.is_running:
@@ -412,8 +514,9 @@ def main():
                     h, w, _ = frame.shape
                     # Take right half (camera on right side of glasses)
                     right_half = frame[:, w // 2:]
-                    # Rotate 90 degrees CLOCKWISE
-                    frame = cv2.rotate(right_half, cv2.ROTATE_90_CLOCKWISE)
+                    # Rotate 90 degrees CLOCKWISE, straight into the frame ring's next slot
+                    rotated = shared_state.frames.next_buffer((w - w // 2, h) + frame.shape[2:], frame.dtype)
+                    frame = cv2.rotate(right_half, cv2.ROTATE_90_CLOCKWISE, dst=rotated)
         
                     # Update dimensions in controllers if changed
                     new_h, new_w = frame.shape[:2]
@@ -427,49 +530,45 @@ def main():
                     
                     # 3. Get Display State (Atomic)
                     display_state = shared_state.get_display_state()
-                    objects = display_state["objects"]
+                    snapshot = display_state["snapshot"]
                     status = display_state["status"]
                     
                     # 4. Draw Overlay (using latest available data)
-                    # We manually inject objects into mode_controller for the draw function
-                    # Note: This is just for drawing; the actual tracking happens in the vision thread
-                    mode_controller.object_manager.objects = objects
+                    # The snapshot is a read-only copy, so the vision thread's objects are never touched here
                     
                     # CRITICAL FIX: Create a COPY for display so we don't draw on the raw frame
                     # that the AI needs to see.
-                    display_frame = frame.copy()
-                    display_frame = draw_enhanced_overlay(display_frame, mode_controller, status)
+                    if display_frame is None or display_frame.shape != frame.shape:
+                        display_frame = np.empty_like(frame)
+                    np.copyto(display_frame, frame)
+                    display_frame = draw_enhanced_overlay(display_frame, mode_controller, status, snapshot)
                     
                     # 5. Display Frame
                     cv2.imshow("Nova Assistive Glasses", display_frame)
                     
                     # 6. Handle Input (Window OR Terminal)
-                    key = cv2.waitKey(1) & 0xFF
-                    
-                    # Check Terminal Input
-                    term_key = console.get_key()
-                    if term_key:
-                        key = ord(term_key)
+                    key = read_key(console)
                     
-                    if key == ord('q') or key == ord('Q'):
+                    if key == 'q':
                         break
-                    elif key == ord('f') or key == ord('F'):
+                    elif key == 'f':
                         print("⚡ Triggering detection...")
                         shared_state.add_command("detect")
-                    elif key == ord('c') or key == ord('C'):
+                    elif key == 'c':
                         if voice_enabled:
                             # 1. Stop any ongoing TTS/Audio immediately (Prevent Segfault)
                             voice_controller.stop_speaking()
                             
                             # 2. INSTANT CAPTURE: Grab frame immediately when button is pressed
                             # This ensures we see exactly what the user is pointing at
-                            with shared_state.lock:
-                                if shared_state.latest_frame is not None:
-                                    captured_frame_for_qa = shared_state.latest_frame.copy()
-                                    print("📸 Frame captured immediately for query")
-                                else:
-                                    captured_frame_for_qa = None
-                                    print("⚠️ No frame available for capture")
+                            # Latest frame is this thread's own ring slot - no lock needed
+                            latest = shared_state.latest_frame
+                            if latest is not None:
+                                captured_frame_for_qa = latest.copy()
+                                print("📸 Frame captured immediately for query")
+                            else:
+                                captured_frame_for_qa = None
+                                print("⚠️ No frame available for capture")
 
                             # 3. Stop Tracking (Clear "F Mode")
                             mode_controller.object_manager.clear()
@@ -480,7 +579,7 @@ def main():
                             voice_controller.start_recording()
                         else:
                             print("❌ Voice control not enabled")
-                    elif key == ord('s') or key == ord('S'):
+                    elif key == 's':
                         if voice_enabled and voice_controller.is_recording:
                             # Run voice processing in a separate thread to avoid blocking UI
                             # Capture context variables
@@ -567,7 +666,7 @@ def main():
                                         elif intent == "quit":
                                             voice_controller.speak("Goodbye", async_mode=True)
                                             time.sleep(1)
-                                            shared_state.is_running = False
+                                            shared_state.stop()
                                         
                                         elif intent == "unknown":
                                             voice_controller.speak("Sorry, I didn't understand that command", async_mode=True)
@@ -577,7 +676,7 @@ def main():
                                            args=(current_qa_frame, current_frame), 
                                            daemon=True).start()
                     
-                    elif key == ord('d') or key == ord('D'):
+                    elif key == 'd':
                         print("\n📖 Describing scene...")
                         if voice_enabled:
                             vision_controller.describe_scene(frame, voice_controller)
@@ -585,7 +684,7 @@ def main():
                             description = vision_controller.get_scene_description(frame)
                             print(f"Scene: {description}")
                     
-                    elif key == ord('m') or key == ord('M'):
+                    elif key == 'm':
                         # Cycle modes
                         modes = [config.NavigationMode.NAVIGATION, config.NavigationMode.OBSTACLE,
                                 config.NavigationMode.SOCIAL, config.NavigationMode.EXPLORATION]
@@ -596,7 +695,7 @@ def main():
                             voice_controller.speak(f"{next_mode} mode", async_mode=True)
                         shared_state.add_command("detect")
                     
-                    elif key == ord('n') or key == ord('N'):
+                    elif key == 'n':
                         print("\n🔄 System Reset: Normal Mode")
                         mode_controller.set_mode(config.NavigationMode.EXPLORATION)
                         mode_controller.object_manager.clear()
@@ -607,18 +706,17 @@ def main():
                             voice_controller.speak("Normal mode", async_mode=True)
                         shared_state.add_command("detect")
                     
-                    elif key == ord('r') or key == ord('R'):
+                    elif key == 'r':
                         print("\n🔄 Manual re-acquisition...")
                         mode_controller.object_manager.clear()
                         shared_state.add_command("detect")
                         
-                    # Wait for 1ms to allow UI updates
-                    # time.sleep(0.001) # Not needed with waitKey(1)
+                    # No sleep needed: read_frame blocks until the camera's next frame
 
             except KeyboardInterrupt:
                 print("\n⚠️ Interrupted by user")
             finally:
-                shared_state.is_running = False # Signal threads to stop
+                shared_state.stop() # Signal threads to stop
                 vision_thread.join(timeout=5) # Wait for vision thread to finish
                 audio_controller.stop_stream()
                 vision_controller.release()
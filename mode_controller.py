@@ -5,10 +5,14 @@ Manages different operating modes with context-aware behavior.
 
 import cv2
 import numpy as np
+import re
 import time
 import config
 from object_manager import ObjectManager
 
+# "Phone [on table]" -> label "Phone", context "on table"
+_LABEL_CTX_RE = re.compile(r"^(.*?)\[(.*?)\]")
+
 class ModeController:
     """
     Manages navigation modes and coordinates system behavior.
@@ -18,6 +22,8 @@ class ModeController:
         """Initialize mode controller."""
         self.current_mode = config.DEFAULT_MODE
         self.target_object = "phone"  # Default tracking target
+        self.frame_width = 640  # Until set_frame_dimensions() is called
+        self.frame_height = 480
         self.object_manager = ObjectManager()
         
         print(f"🎮 ModeController initialized | Mode: {self.current_mode}")
@@ -130,7 +136,7 @@ class ModeController:
         
         count = 0
         frame_height, frame_width = frame.shape[:2]
-        import time
+        now = time.monotonic()
         
         for det in detections:
             try:
@@ -160,9 +166,8 @@ class ModeController:
                 new_bbox = (x, y, w, h)
                 
                 # Parse label for context (e.g. "Phone [on table]")
-                import re
                 context = None
-                match = re.search(r"^(.*?)\[(.*?)\]", label)
+                match = _LABEL_CTX_RE.search(label)
                 if match:
                     label = match.group(1).strip()
                     context = match.group(2).strip()
@@ -199,7 +204,7 @@ class ModeController:
                         
                         # ALWAYS update metadata
                         if iou > 0.1: # If it's likely the same object
-                            existing_obj.last_verified = time.time()
+                            existing_obj.last_verified = now
                             existing_obj.context = context # Update context
                             existing_obj.is_lost = False
                             existing_obj.lost_time = None
@@ -266,10 +271,7 @@ class ModeController:
         
         elif strategy == "closest":
             # Get closest object (largest bbox)
-            return self.object_manager.get_closest_object(
-                self.frame_width if hasattr(self, 'frame_width') else 640,
-                self.frame_height if hasattr(self, 'frame_height') else 480
-            )
+            return self.object_manager.get_closest_object(self.frame_width, self.frame_height)
         
         elif strategy == "people":
             # Get first person
@@ -297,14 +299,16 @@ class ModeController:
         if not self.object_manager.objects:
             return None
             
-        # Sort by threat score descending
-        sorted_objects = sorted(self.object_manager.objects, key=lambda o: o.threat_score, reverse=True)
-        return sorted_objects[0]
+        # Single scan; ties keep the earliest object, as the stable descending sort did
+        return max(self.object_manager.objects, key=lambda o: o.threat_score)
 
-    def check_lost_threats(self):
+    def check_lost_threats(self, now=None):
         """
         Check if the main threat has been lost for too long.
         
+        Args:
+            now: time.monotonic() timestamp for this tick (read if omitted)
+        
         Returns:
             True if a re-scan is needed, False otherwise.
         """
@@ -314,7 +318,7 @@ class ModeController:
             
         # If the main threat is lost
         if main_threat.is_lost and main_threat.lost_time:
-            elapsed = time.time() - main_threat.lost_time
+            elapsed = (time.monotonic() if now is None else now) - main_threat.lost_time
             
             # Only trigger if it's a significant threat (score > 0.3)
             if main_threat.threat_score > 0.3 and elapsed > 2.0:
@@ -6,11 +6,111 @@ Handles detection, tracking, and management of multiple objects with unique iden
 import cv2
 import numpy as np
 import config
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from typing import List, Optional, Dict
+from concurrent.futures import ThreadPoolExecutor
+import sys
 import time
 
-@dataclass
+# Numba is optional - the zone and IoU kernels fall back to Python/NumPy without it
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
+def _proximity_zones_numpy(boxes, frame_area, zone_mins, zone_maxs, default_zone):
+    """
+    Zone index per (N, 4) float64 box (NumPy fallback).
+
+    First zone whose [min, max) range holds the area ratio wins, same as
+    get_proximity_zone; boxes outside every range get default_zone.
+    """
+    size_ratio = boxes[:, 2] * boxes[:, 3] / frame_area
+    zones = np.full(boxes.shape[0], default_zone, dtype=np.int32)
+    for i in range(zone_mins.shape[0] - 1, -1, -1):
+        zones[(zone_mins[i] <= size_ratio) & (size_ratio < zone_maxs[i])] = i
+    return zones
+
+
+if NUMBA_AVAILABLE:
+    @njit(cache=True)
+    def _proximity_zones(boxes, frame_area, zone_mins, zone_maxs, default_zone):
+        """Per-box zone scan without NumPy temporaries (same contract as the NumPy version)."""
+        n = boxes.shape[0]
+        zones = np.empty(n, dtype=np.int32)
+        for i in range(n):
+            size_ratio = boxes[i, 2] * boxes[i, 3] / frame_area
+            zone = default_zone
+            for z in range(zone_mins.shape[0]):
+                if zone_mins[z] <= size_ratio < zone_maxs[z]:
+                    zone = z
+                    break
+            zones[i] = zone
+        return zones
+else:
+    _proximity_zones = _proximity_zones_numpy
+
+
+def _box_iou(x1, y1, w1, h1, x2, y2, w2, h2):
+    """IoU of two (x, y, w, h) boxes passed as scalars."""
+    xA = max(x1, x2)
+    yA = max(y1, y2)
+    xB = min(x1 + w1, x2 + w2)
+    yB = min(y1 + h1, y2 + h2)
+
+    interArea = max(0.0, xB - xA) * max(0.0, yB - yA)
+    unionArea = w1 * h1 + w2 * h2 - interArea
+    if unionArea == 0:
+        return 0.0
+    return interArea / unionArea
+
+
+if NUMBA_AVAILABLE:
+    # Single float64 signature: compiled once at import, ints are widened on the way in
+    _box_iou = njit("float64(float64, float64, float64, float64, "
+                    "float64, float64, float64, float64)", cache=True)(_box_iou)
+
+# Tracker factory names per config.TRACKER_BACKEND value, fastest first
+_TRACKER_FACTORIES = {
+    "mosse": "TrackerMOSSE_create",
+    "kcf": "TrackerKCF_create",
+    "csrt": "TrackerCSRT_create",
+}
+
+
+def _create_tracker(backend):
+    """
+    Create an OpenCV tracker for the given backend name.
+
+    Falls back to the other backends (cv2 first, then cv2.legacy) when the
+    requested one is not in this OpenCV build. Returns None if none are.
+    """
+    for name in [backend] + [b for b in ("kcf", "csrt", "mosse") if b != backend]:
+        factory = _TRACKER_FACTORIES.get(name)
+        if factory is None:
+            continue
+        for module in (cv2, getattr(cv2, 'legacy', None)):
+            if module is not None and hasattr(module, factory):
+                if name != backend:
+                    print(f"⚠️ {backend.upper()} tracker not found, falling back to {name.upper()}")
+                return getattr(module, factory)()
+    return None
+
+
+def _scale_bbox(bbox, scale):
+    """Scale an (x, y, w, h) box to integer pixels, keeping at least 1px of size."""
+    x, y, w, h = bbox
+    return (int(round(x * scale)), int(round(y * scale)),
+            max(1, int(round(w * scale))), max(1, int(round(h * scale))))
+
+
+# slots=True needs Python 3.10; older interpreters get a regular dataclass
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class TrackedObject:
     """Represents a single tracked object with all its properties."""
     
@@ -31,9 +131,14 @@ class TrackedObject:
     last_template_update: float = 0.0
     context: Optional[str] = None
     last_verified: float = 0.0
+    label_lc: str = field(init=False, repr=False, compare=False)  # Lowercased label for lookups
+
+    def __post_init__(self):
+        """Cache the lowercased label (labels are not reassigned after creation)."""
+        self.label_lc = self.label.lower()
     
-    def update_velocity(self, new_bbox):
-        """Calculate velocity based on bbox movement."""
+    def update_velocity(self, new_bbox, now=None):
+        """Calculate velocity based on bbox movement (now: monotonic timestamp, read if omitted)."""
         if self.bbox:
             old_center_x = self.bbox[0] + self.bbox[2] / 2
             old_center_y = self.bbox[1] + self.bbox[3] / 2
@@ -46,7 +151,7 @@ class TrackedObject:
             self.velocity = (vx, vy)
         
         self.bbox = new_bbox
-        self.last_update = time.time()
+        self.last_update = time.monotonic() if now is None else now
     
     def predict_position(self, horizon_seconds=0.5):
         """Predict future position based on current velocity."""
@@ -69,6 +174,39 @@ class TrackedObject:
         self.predicted_bbox = (int(pred_x), int(pred_y), self.bbox[2], self.bbox[3])
 
 
+@dataclass(frozen=True)
+class ObjectSnapshot:
+    """
+    Read-only struct-of-arrays copy of the tracked objects that have a bbox.
+    Built once per vision tick so the UI never reads live TrackedObjects.
+    """
+
+    ids: np.ndarray               # (N,) int32
+    labels: tuple                 # (N,) str
+    colors: tuple                 # (N,) BGR tuples
+    bboxes: np.ndarray            # (N, 4) float64 (x, y, w, h)
+    predicted_bboxes: np.ndarray  # (N, 4) float64, zeros where has_pred is False
+    has_pred: np.ndarray          # (N,) bool
+    object_count: int             # All tracked objects, including ones without a bbox
+
+    @classmethod
+    def from_objects(cls, objects):
+        """Build a snapshot from a list of TrackedObjects."""
+        drawn = [obj for obj in objects if obj.bbox]
+        ids = np.array([obj.id for obj in drawn], dtype=np.int32)
+        bboxes = np.array([obj.bbox for obj in drawn], dtype=np.float64).reshape(-1, 4)
+        has_pred = np.array([bool(obj.predicted_bbox) for obj in drawn], dtype=bool)
+        predicted_bboxes = np.array([obj.predicted_bbox or (0, 0, 0, 0) for obj in drawn],
+                                    dtype=np.float64).reshape(-1, 4)
+        for array in (ids, bboxes, has_pred, predicted_bboxes):
+            array.flags.writeable = False
+        return cls(ids, tuple(obj.label for obj in drawn), tuple(obj.color for obj in drawn),
+                   bboxes, predicted_bboxes, has_pred, len(objects))
+
+    def __len__(self):
+        return self.ids.shape[0]
+
+
 class ObjectManager:
     """
     Manages multiple tracked objects with unique identities and audio signatures.
@@ -86,6 +224,12 @@ class ObjectManager:
             (255, 0, 255),  # Magenta
             (0, 255, 255),  # Yellow
         ]
+        # Trackers see frames at this scale; fixed per manager so init and update agree
+        self.tracker_scale = config.TRACKER_SCALE
+        # Persistent pool for tracker.update(); threads start on first use
+        self._tracker_pool = (ThreadPoolExecutor(max_workers=config.TRACKER_WORKERS,
+                                                 thread_name_prefix="tracker")
+                              if config.TRACKER_WORKERS > 1 else None)
         print("📦 ObjectManager initialized.")
     
     def add_object(self, label, bbox, confidence=1.0, context=None):
@@ -108,6 +252,7 @@ class ObjectManager:
         color = self.color_palette[self.next_id % len(self.color_palette)]
         
         # Create object
+        now = time.monotonic()
         obj = TrackedObject(
             id=self.next_id,
             label=label,
@@ -116,14 +261,14 @@ class ObjectManager:
             confidence=confidence,
             audio_signature=audio_sig,
             color=color,
-            last_update=time.time(),
+            last_update=now,
             threat_score=0.0,
             is_lost=False,
             lost_time=None,
             template=None,
             last_template_update=0.0,
             context=context,
-            last_verified=time.time()
+            last_verified=now
         )
         
         self.objects.append(obj)
@@ -146,19 +291,32 @@ class ObjectManager:
     
     def get_objects_by_label(self, label):
         """Get all objects matching a label."""
-        return [obj for obj in self.objects if obj.label.lower() == label.lower()]
+        label_lc = label.lower()
+        return [obj for obj in self.objects if obj.label_lc == label_lc]
     
     def clear(self):
         """Clear all tracked objects."""
         self.objects.clear()
         print("🗑️ Cleared all objects.")
-    
-    def update_trackers(self, frame):
+
+    def snapshot(self):
+        """Get a read-only ObjectSnapshot of the current objects."""
+        return ObjectSnapshot.from_objects(self.objects)
+
+    def _tracker_frame(self, frame):
+        """Resize a frame to tracker resolution."""
+        if self.tracker_scale == 1.0:
+            return frame
+        return cv2.resize(frame, None, fx=self.tracker_scale, fy=self.tracker_scale,
+                          interpolation=cv2.INTER_AREA)
+
+    def update_trackers(self, frame, now=None):
         """
         Update all object trackers with a new frame.
         
         Args:
             frame: New video frame
+            now: time.monotonic() timestamp for this tick (read if omitted)
         
         Returns:
             List of successfully tracked objects
@@ -166,22 +324,45 @@ class ObjectManager:
         # Early exit if no objects to track
         if not self.objects:
             return []
+        if now is None:
+            now = time.monotonic()
         
         tracked = []
         failed = []
+
+        # Frame constants for threat scoring
+        frame_area = frame.shape[0] * frame.shape[1]
+        frame_center_x = frame.shape[1] / 2
+
+        # Resize once; every tracker updates on the same small frame
+        tracker_frame = None
+        if any(obj.tracker is not None for obj in self.objects):
+            tracker_frame = self._tracker_frame(frame)
+
+        # tracker.update() releases the GIL inside OpenCV, so with several trackers
+        # run the updates on the pool; results are consumed in object order below
+        pending = {}
+        if self._tracker_pool is not None:
+            active = [obj for obj in self.objects if obj.tracker is not None]
+            if len(active) >= 2:
+                pending = {obj.id: self._tracker_pool.submit(obj.tracker.update, tracker_frame)
+                           for obj in active}
         
         for obj in self.objects:
             # Skip if tracker not initialized
             if obj.tracker is None:
                 if not obj.is_lost:
                     obj.is_lost = True
-                    obj.lost_time = time.time()
+                    obj.lost_time = now
                 continue
                 
             try:
-                ok, bbox = obj.tracker.update(frame)
+                future = pending.get(obj.id)
+                ok, bbox = future.result() if future is not None else obj.tracker.update(tracker_frame)
                 if ok:
-                    obj.update_velocity(bbox)
+                    if self.tracker_scale != 1.0:
+                        bbox = _scale_bbox(bbox, 1.0 / self.tracker_scale)
+                    obj.update_velocity(bbox, now)
                     obj.is_lost = False
                     obj.lost_time = None
                     
@@ -192,18 +373,11 @@ class ObjectManager:
                     # === THREAT SCORE CALCULATION ===
                     # 1. Base Score: Proximity (Size)
                     area = bbox[2] * bbox[3]
-                    frame_area = frame.shape[0] * frame.shape[1]
                     size_score = min(1.0, area / (frame_area * 0.5)) # Cap at 50% screen coverage
                     
-                    # 2. Semantic Score: Type Importance
-                    # Normalize label to lowercase for lookup
-                    label_key = obj.label.lower().split(" ")[-1] # Handle "Red Cup" -> "cup"
-                    semantic_score = config.THREAT_PRIORITIES.get(label_key, config.THREAT_PRIORITIES["default"])
-                    
-                    # 3. Centrality Score: Is it in front of us?
+                    # 2. Centrality Score: Is it in front of us?
                     center_x = bbox[0] + bbox[2] / 2
-                    frame_center_x = frame.shape[1] / 2
-                    dist_from_center = abs(center_x - frame_center_x) / (frame.shape[1] / 2)
+                    dist_from_center = abs(center_x - frame_center_x) / frame_center_x
                     centrality_score = 1.0 - min(1.0, dist_from_center)
                     
                     obj.threat_score = (size_score * 0.7) + (centrality_score * 0.3)
@@ -214,7 +388,7 @@ class ObjectManager:
                     if not obj.is_lost:
                         print(f"⚠️ Tracker lost for object #{obj.id} ({obj.label})")
                         obj.is_lost = True
-                        obj.lost_time = time.time()
+                        obj.lost_time = now
                     failed.append(obj)
             except Exception as e:
                 print(f"⚠️ Tracker error for object #{obj.id}: {e}")
@@ -235,22 +409,15 @@ class ObjectManager:
         if obj and obj.bbox:
             # Robust tracker initialization (optional - requires opencv-contrib-python)
             try:
-                # Try standard OpenCV 4+
-                if hasattr(cv2, 'TrackerCSRT_create'):
-                    obj.tracker = cv2.TrackerCSRT_create()
-                # Try legacy (OpenCV 4.5+)
-                elif hasattr(cv2, 'legacy') and hasattr(cv2.legacy, 'TrackerCSRT_create'):
-                    obj.tracker = cv2.legacy.TrackerCSRT_create()
-                # Fallback to KCF (faster but less accurate)
-                elif hasattr(cv2, 'TrackerKCF_create'):
-                    print("⚠️ CSRT not found, falling back to KCF")
-                    obj.tracker = cv2.TrackerKCF_create()
-                else:
+                obj.tracker = _create_tracker(config.TRACKER_BACKEND)
+                if obj.tracker is None:
                     # Trackers not available - detection-only mode (requires opencv-contrib-python for tracking)
-                    obj.tracker = None
                     return
                 
-                obj.tracker.init(frame, obj.bbox)
+                tracker_bbox = obj.bbox
+                if self.tracker_scale != 1.0:
+                    tracker_bbox = _scale_bbox(obj.bbox, self.tracker_scale)
+                obj.tracker.init(self._tracker_frame(frame), tracker_bbox)
                 print(f"🎯 Initialized tracker for object #{obj_id} ({obj.label})")
             except Exception as e:
                 print(f"❌ Failed to init tracker: {e}")
@@ -296,18 +463,19 @@ class ObjectManager:
         center_x = frame_width / 2
         center_y = frame_height / 2
         
-        min_dist = float('inf')
+        # Compare squared distances - same ordering, no per-object sqrt
+        min_dist_sq = float('inf')
         centered = None
-        
+
         for obj in self.objects:
             if obj.bbox:
-                obj_center_x = obj.bbox[0] + obj.bbox[2] / 2
-                obj_center_y = obj.bbox[1] + obj.bbox[3] / 2
-                
-                dist = np.sqrt((obj_center_x - center_x)**2 + (obj_center_y - center_y)**2)
-                
-                if dist < min_dist:
-                    min_dist = dist
+                dx = obj.bbox[0] + obj.bbox[2] / 2 - center_x
+                dy = obj.bbox[1] + obj.bbox[3] / 2 - center_y
+
+                dist_sq = dx * dx + dy * dy
+
+                if dist_sq < min_dist_sq:
+                    min_dist_sq = dist_sq
                     centered = obj
         
         return centered
@@ -319,8 +487,8 @@ class ObjectManager:
         Args:
             labels: List of label strings
         """
-        labels_lower = [l.lower() for l in labels]
-        self.objects = [obj for obj in self.objects if obj.label.lower() in labels_lower]
+        labels_lower = {l.lower() for l in labels}
+        self.objects = [obj for obj in self.objects if obj.label_lc in labels_lower]
     
     def limit_objects(self, max_count):
         """
@@ -362,6 +530,21 @@ class ObjectManager:
         
         return "safe"
 
+    def get_proximity_zones(self, boxes, frame_width, frame_height):
+        """
+        Determine proximity zones for many boxes at once.
+
+        Args:
+            boxes: (N, 4) float64 array of (x, y, w, h)
+            frame_width, frame_height: Frame dimensions
+
+        Returns:
+            int32 array of indices into config.PROXIMITY_ZONE_NAMES
+        """
+        return _proximity_zones(boxes, float(frame_width * frame_height),
+                                config.PROXIMITY_ZONE_MINS, config.PROXIMITY_ZONE_MAXS,
+                                config.SAFE_ZONE_INDEX)
+
     def update_template(self, obj, frame):
         """
         Update the visual template for an object.
@@ -382,34 +565,24 @@ class ObjectManager:
         if w < 10 or h < 10:
             return
             
-        template = frame[y:y+h, x:x+w]
-        obj.template = template
-        obj.last_template_update = time.time()
+        # Own copy of the ROI: a view would keep the whole frame alive per object
+        obj.template = frame[y:y+h, x:x+w].copy()
+        obj.last_template_update = time.monotonic()
         # print(f"📸 Updated template for #{obj.id}")
 
     def compute_iou(self, box1, box2):
         """Compute Intersection over Union (IoU) between two boxes."""
         x1, y1, w1, h1 = box1
         x2, y2, w2, h2 = box2
-        
-        xA = max(x1, x2)
-        yA = max(y1, y2)
-        xB = min(x1 + w1, x2 + w2)
-        yB = min(y1 + h1, y2 + h2)
-        
-        interArea = max(0, xB - xA) * max(0, yB - yA)
-        box1Area = w1 * h1
-        box2Area = w2 * h2
-        
-        if float(box1Area + box2Area - interArea) == 0:
+        # Disjoint boxes (the common case) have no intersection - skip the kernel call
+        if x1 + w1 <= x2 or x2 + w2 <= x1 or y1 + h1 <= y2 or y2 + h2 <= y1:
             return 0.0
-            
-        iou = interArea / float(box1Area + box2Area - interArea)
-        return iou
+        return _box_iou(x1, y1, w1, h1, x2, y2, w2, h2)
 
-    def cleanup_stale_trackers(self, max_age=30.0):
+    def cleanup_stale_trackers(self, max_age=30.0, now=None):
         """Remove objects not verified by Gemini for max_age seconds."""
-        now = time.time()
+        if now is None:
+            now = time.monotonic()
         active_count = len(self.objects)
         
         self.objects = [obj for obj in self.objects 
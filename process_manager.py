@@ -13,8 +13,8 @@ import psutil
 
 TARGET_SCRIPT = "main_enhanced.py"
 
-def get_target_processes():
-    """Find all processes running the target script."""
+def _get_target_processes_psutil():
+    """Find target processes via psutil (platforms without /proc)."""
     procs = []
     for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
         try:
@@ -25,6 +25,30 @@ def get_target_processes():
             pass
     return procs
 
+def get_target_processes():
+    """Find all processes running the target script."""
+    if not os.path.isdir('/proc'):
+        return _get_target_processes_psutil()
+
+    # Linux: read cmdlines straight from /proc (NUL-separated args) and only
+    # build psutil Process objects for the matches, for terminate/wait_procs
+    target = TARGET_SCRIPT.encode()
+    procs = []
+    for pid in os.listdir('/proc'):
+        if not pid.isdigit():
+            continue
+        try:
+            with open(f'/proc/{pid}/cmdline', 'rb') as f:
+                cmdline = f.read()
+        except OSError:
+            continue  # Exited, or hidden from us
+        if target in cmdline:
+            try:
+                procs.append(psutil.Process(int(pid)))
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+    return procs
+
 def kill_processes():
     """Terminate target processes gracefully, then forcefully."""
     procs = get_target_processes()
@@ -1,6 +1,55 @@
 import threading
 import copy
 import time
+from collections import deque
+import numpy as np
+from object_manager import ObjectSnapshot
+
+
+class FrameRing:
+    """
+    Single-producer/single-consumer ring of reusable frame buffers.
+    The producer fills a slot in place and publishes it by bumping a sequence
+    counter; readers copy the newest slot without taking a lock and retry if
+    the producer wrapped around onto it mid-copy.
+    """
+    def __init__(self, slots=3):
+        self._slots = [None] * slots
+        # Frames published so far; the newest frame is in slot (seq - 1) % slots.
+        # Plain int rebinding is atomic under the GIL.
+        self._seq = 0
+
+    @property
+    def seq(self):
+        return self._seq
+
+    def next_buffer(self, shape, dtype=np.uint8):
+        """Producer: buffer for the next frame (not visible to readers until publish)."""
+        index = self._seq % len(self._slots)
+        buffer = self._slots[index]
+        if buffer is None or buffer.shape != shape or buffer.dtype != dtype:
+            buffer = self._slots[index] = np.empty(shape, dtype=dtype)
+        return buffer
+
+    def publish(self):
+        """Producer: make the buffer from next_buffer the latest frame."""
+        self._seq += 1
+
+    def latest(self):
+        """Newest published buffer without copying (producer thread only)."""
+        seq = self._seq
+        return self._slots[(seq - 1) % len(self._slots)] if seq else None
+
+    def read(self):
+        """Consumer: copy of the newest frame, or None before the first publish."""
+        while True:
+            seq = self._seq
+            if not seq:
+                return None
+            frame = self._slots[(seq - 1) % len(self._slots)].copy()
+            # The producer only rewrites this slot after publishing slots - 1 more frames
+            if self._seq - seq <= len(self._slots) - 2:
+                return frame
 
 class SharedGameState:
     """
@@ -8,18 +57,25 @@ class SharedGameState:
     Ensures the UI never freezes while waiting for AI/Tracking.
     """
     def __init__(self):
+        # Guards the tracking fields only; frames and commands are lock-free
         self._lock = threading.Lock()
         
-        # Latest frame for display (Video Thread writes, UI reads)
-        self.latest_frame = None
-        self.frame_id = 0
+        # Latest frames (Video Thread writes, Vision reads) - lock-free ring
+        self.frames = FrameRing()
+        
+        # Set whenever a new frame is published (Vision waits on it)
+        self._frame_ready = threading.Event()
         
         # Latest tracking results (Vision Thread writes, UI/Audio reads)
         self.tracked_objects = []
+        self.tracked_snapshot = ObjectSnapshot.from_objects([])  # Same objects as arrays, for drawing
         self.tracking_status = "READY"  # READY, SEARCHING, TRACKING, LOST
         
-        # Command queue (UI writes, Vision reads)
-        self.command_queue = []
+        # Set whenever new tracking results are published (Audio waits on it)
+        self._tracking_updated = threading.Event()
+        
+        # Command queue (UI writes, Vision reads) - deque append/popleft are atomic
+        self.command_queue = deque()
         
         # System status
         self.is_running = True
@@ -29,42 +85,85 @@ class SharedGameState:
     def lock(self):
         return self._lock
         
+    @property
+    def latest_frame(self):
+        """Newest published frame, not copied (Video Thread only)."""
+        return self.frames.latest()
+
+    @property
+    def frame_id(self):
+        return self.frames.seq
+
     def update_frame(self, frame):
-        """Update the latest video frame."""
-        with self._lock:
-            self.latest_frame = frame
-            self.frame_id += 1
+        """Update the latest video frame (copies unless frame came from frames.next_buffer)."""
+        buffer = self.frames.next_buffer(frame.shape, frame.dtype)
+        if buffer is not frame:
+            np.copyto(buffer, frame)
+        self.frames.publish()
+        self._frame_ready.set()
             
     def get_latest_frame(self):
         """Get the latest frame for processing."""
-        with self._lock:
-            return self.latest_frame.copy() if self.latest_frame is not None else None
+        return self.frames.read()
+    
+    def wait_for_frame(self, timeout=None):
+        """
+        Block until a new frame is published.
+        Returns True if a frame arrived, False on timeout.
+        """
+        ready = self._frame_ready.wait(timeout)
+        self._frame_ready.clear()
+        return ready
             
     def update_tracking(self, objects, status):
         """Update tracking results."""
+        # Built outside the lock, on the thread that owns the objects
+        snapshot = ObjectSnapshot.from_objects(objects)
         with self._lock:
             # Shallow copy of list - objects themselves are safe to share
             self.tracked_objects = list(objects)
+            self.tracked_snapshot = snapshot
             self.tracking_status = status
+        self._tracking_updated.set()
+        
+    def wait_for_update(self, timeout=None):
+        """
+        Block until new tracking results are published.
+        Returns True if an update arrived, False on timeout.
+        """
+        updated = self._tracking_updated.wait(timeout)
+        self._tracking_updated.clear()
+        return updated
             
     def get_display_state(self):
-        """Get all data needed for UI rendering in one atomic operation."""
+        """
+        Get all data needed for UI rendering (tracking fields read together under the lock).
+        Called from the UI and audio threads, so no frame: use get_latest_frame() for a copy.
+        """
         with self._lock:
-            return {
-                "frame": self.latest_frame,
-                "objects": self.tracked_objects,
-                "status": self.tracking_status,
-                "fps": self.fps
-            }
+            objects = self.tracked_objects
+            snapshot = self.tracked_snapshot
+            status = self.tracking_status
+        return {
+            "objects": objects,
+            "snapshot": snapshot,
+            "status": status,
+            "fps": self.fps
+        }
             
     def add_command(self, command):
         """Add a command for the vision thread (e.g., "detect")."""
-        with self._lock:
-            self.command_queue.append(command)
+        self.command_queue.append(command)
             
     def get_next_command(self):
         """Get next command for vision thread."""
-        with self._lock:
-            if self.command_queue:
-                return self.command_queue.pop(0)
+        try:
+            return self.command_queue.popleft()
+        except IndexError:
             return None
+
+    def stop(self):
+        """Signal all threads to stop and wake any that are waiting."""
+        self.is_running = False
+        self._frame_ready.set()
+        self._tracking_updated.set()
@@ -13,6 +13,9 @@ if not cap.isOpened():
     print("❌ Cannot open camera index 2. Trying index 0...")
     cap = cv2.VideoCapture(0)
 
+# Use MJPG (like the main app) so 720p doesn't saturate USB with raw YUYV
+cap.set(cv2.CAP_PROP_FOURCC, cv2.VideoWriter_fourcc(*'MJPG'))
+
 # Set resolution
 cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
 cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
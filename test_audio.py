@@ -27,8 +27,9 @@ except Exception as e:
 print("\n🎵 Generating Test Tone (440Hz Sine Wave)...")
 fs = 44100
 duration = 2.0  # seconds
-t = np.linspace(0, duration, int(fs * duration), False)
-tone = 0.5 * np.sin(2 * np.pi * 440 * t)  # 0.5 amplitude
+# float32 end to end: PortAudio plays float32, so sounddevice needn't convert
+t = np.linspace(0, duration, int(fs * duration), False, dtype=np.float32)
+tone = np.float32(0.5) * np.sin(np.float32(2 * np.pi * 440) * t)  # 0.5 amplitude
 
 # 4. Play Tone
 print("▶️ Playing tone...")
@@ -1,8 +1,10 @@
 
-import math
 import unittest
+from unittest import mock
 from dataclasses import dataclass
 
+import audio_hrtf
+
 # Mock classes to simulate the environment
 @dataclass
 class MockObject:
@@ -12,34 +14,36 @@ class MockObject:
 
 class MockAudioController:
     def __init__(self):
-        self.sources = {}
-        self.gains = {} # Store gains for verification
+        # Real HRTF_AudioController, built without touching an OpenAL device
+        with mock.patch.object(audio_hrtf, "OPENAL_AVAILABLE", False):
+            self.controller = audio_hrtf.HRTF_AudioController()
+        self.controller.free_sources = list(range(100, 110))
+        self.gains = {} # Store gains for verification (source -> AL_GAIN)
+
+    def _alSourcef(self, source, param, value):
+        if param == "AL_GAIN":
+            self.gains[source] = value
 
     def _update_scene(self, objects):
-        # Re-implementing the logic from audio_hrtf.py for testing purposes
-        # or ideally, we would import it if it was a pure function.
-        # Since it's embedded in the class and uses OpenAL, we'll extract the logic here
-        # to verify the math is correct.
-        
-        width = 1280
-        height = 720
-        max_area = width * height * 0.5
+        # Run audio_hrtf's own distance/gain pass with the OpenAL calls stubbed,
+        # then read back what it would have sent to each source
+        openal_stubs = {name: mock.DEFAULT for name in
+                        ("alSourcefv", "alSourcei", "alSourcePlay", "alSourceStop", "alGenSources")}
+        openal_stubs.update(AL_GAIN="AL_GAIN", AL_POSITION="AL_POSITION", AL_BUFFER="AL_BUFFER",
+                            AL_LOOPING="AL_LOOPING", AL_TRUE=1)
+        with mock.patch.multiple(audio_hrtf, create=True, OPENAL_AVAILABLE=True,
+                                 alSourcef=self._alSourcef, **openal_stubs):
+            self.controller._update_scene(objects)
         
         results = {}
 
         for obj in objects:
-            area = obj.bbox[2] * obj.bbox[3]
-            
-            # The logic from audio_hrtf.py
-            dist = max(0.5, min(10.0, math.sqrt(max_area / (area + 1))))
-            
-            ref_dist = 1.0 
-            gain = min(1.0, ref_dist / (dist * 0.5))
-            gain = max(0.1, gain)
+            source = self.controller.sources[obj.id]
             
             results[obj.id] = {
-                "dist": dist,
-                "gain": gain,
+                # audio_hrtf places every source at z = -dist
+                "dist": -self.controller.position_buffers[obj.id][2],
+                "gain": self.gains[source],
                 "label": obj.label
             }
             
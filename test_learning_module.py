@@ -0,0 +1,129 @@
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+
+import numpy as np
+
+import config
+from learning_module import LearningModule
+
+
+class TestLearningModule(unittest.TestCase):
+    def setUp(self):
+        # Temp-file DB, so the read-only connection only sees committed rows
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache_dir = os.path.join(self.tmp.name, "cache")
+        self.learning = LearningModule(os.path.join(self.tmp.name, "learning.db"), self.cache_dir)
+
+    def tearDown(self):
+        self.learning.close()
+        self.tmp.cleanup()
+
+    def save_crop(self, seed):
+        # Random noise, so every seed gives a distinct image hash
+        frame = np.random.default_rng(seed).integers(0, 255, (100, 100, 3), dtype=np.uint8)
+        self.learning.save_detection(frame, "cup", (0, 0, 50, 50), 0.9, 100, 100)
+        return self.learning.conn.execute(
+            "SELECT image_path FROM objects ORDER BY id DESC LIMIT 1").fetchone()[0]
+
+    def test_nested_transaction_commits_at_outermost_exit(self):
+        with self.learning.transaction():
+            self.learning.set_preference("outer", "1")
+            with self.learning.transaction():
+                self.learning.set_preference("inner", "2")
+            # Inner exit joined the outer transaction - nothing committed yet
+            self.assertIsNone(self.learning.get_preference("inner"))
+
+        self.assertEqual(self.learning.get_preference("outer"), "1")
+        self.assertEqual(self.learning.get_preference("inner"), "2")
+
+    def test_transaction_rolls_back_on_exception(self):
+        with self.assertRaises(RuntimeError):
+            with self.learning.transaction():
+                self.learning.set_preference("doomed", "1")
+                raise RuntimeError("abort")
+
+        self.assertIsNone(self.learning.get_preference("doomed"))
+
+        # The connection is usable again afterwards
+        self.learning.set_preference("after", "2")
+        self.assertEqual(self.learning.get_preference("after"), "2")
+
+    def test_transactions_on_two_threads_are_serialized(self):
+        inside = threading.Event()
+        order = []
+
+        def failing_writer():
+            try:
+                with self.learning.transaction():
+                    self.learning.set_preference("worker", "1")
+                    inside.set()
+                    time.sleep(0.2)
+                    order.append("worker rolled back")
+                    raise RuntimeError("abort")
+            except RuntimeError:
+                pass
+
+        worker = threading.Thread(target=failing_writer)
+        worker.start()
+        inside.wait(timeout=5)
+
+        # Must wait for the worker's transaction, not join it and get rolled back with it
+        self.learning.set_preference("main", "2")
+        order.append("main committed")
+        worker.join()
+
+        self.assertEqual(order, ["worker rolled back", "main committed"])
+        self.assertIsNone(self.learning.get_preference("worker"))
+        self.assertEqual(self.learning.get_preference("main"), "2")
+
+    def test_eviction_removes_least_recently_used(self):
+        limit, extra = 3, 2
+        with mock.patch.object(config, "MAX_CACHED_IMAGES", limit):
+            paths = [self.save_crop(seed) for seed in range(limit)]
+
+            # Seeing crop 0 again makes it the most recently used
+            self.save_crop(0)
+
+            paths += [self.save_crop(seed) for seed in range(limit, limit + extra)]
+
+        # Exactly `extra` victims: the oldest by last_access, not by insertion
+        evicted = [paths[1], paths[2]]
+        kept = [paths[0], paths[3], paths[4]]
+        rows = [path for (path,) in self.learning.conn.execute("SELECT image_path FROM objects")]
+        files = os.listdir(self.cache_dir)
+
+        self.assertEqual(sorted(rows), sorted(kept))
+        self.assertEqual(sorted(files), sorted(os.path.basename(path) for path in kept))
+        for path in evicted:
+            self.assertFalse(os.path.exists(path), f"{path} should have been evicted")
+
+        self.assertEqual(self.learning._cache_count, len(files))
+        self.assertEqual(self.learning._cache_bytes,
+                         sum(os.path.getsize(os.path.join(self.cache_dir, name)) for name in files))
+
+    def test_eviction_count_survives_missing_files(self):
+        limit = 3
+        with mock.patch.object(config, "MAX_CACHED_IMAGES", limit):
+            paths = [self.save_crop(seed) for seed in range(limit)]
+
+            # The next victim's file vanishes behind our back
+            os.unlink(paths[0])
+            paths += [self.save_crop(seed) for seed in range(limit, limit + 2)]
+
+        files = os.listdir(self.cache_dir)
+        self.assertEqual(len(files), limit)
+        self.assertEqual(self.learning._cache_count, len(files))
+
+        # Orphan files with no objects row are not counted on restart
+        with open(os.path.join(self.cache_dir, "orphan.jpg"), "wb") as f:
+            f.write(b"\xff\xd8")
+        self.learning.close()
+        self.learning = LearningModule(self.learning.db_path, self.cache_dir)
+        self.assertEqual(self.learning._cache_count, limit)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,77 @@
+import unittest
+
+import numpy as np
+
+from shared_state import FrameRing
+
+
+class InterruptedSlot(np.ndarray):
+    """Ring slot whose next copy() is interrupted halfway by the producer (set .interrupt)."""
+    def copy(self, *args, **kwargs):
+        interrupt = getattr(self, "interrupt", None)
+        if interrupt is None:
+            return np.array(self)
+        self.interrupt = None
+        half = self.shape[0] // 2
+        copied = np.empty(self.shape, dtype=self.dtype)
+        copied[:half] = self[:half]
+        interrupt()
+        copied[half:] = self[half:]
+        return copied
+
+
+class TestFrameRing(unittest.TestCase):
+    SHAPE = (4, 4)
+
+    def publish(self, ring, value):
+        buffer = ring.next_buffer(self.SHAPE)
+        buffer.fill(value)
+        ring.publish()
+
+    def interrupt_newest(self, ring, *values):
+        # Swap the newest slot for one that publishes `values` mid-copy
+        index = (ring.seq - 1) % len(ring._slots)
+        slot = ring._slots[index].view(InterruptedSlot)
+        slot.interrupt = lambda: [self.publish(ring, value) for value in values]
+        ring._slots[index] = slot
+
+    def test_read_before_first_publish(self):
+        self.assertIsNone(FrameRing().read())
+
+    def test_read_returns_a_copy_of_the_newest_frame(self):
+        ring = FrameRing(slots=3)
+        for value in (1, 2):
+            self.publish(ring, value)
+
+        frame = ring.read()
+        self.publish(ring, 3)  # Reusing slots must not change what the reader got
+
+        self.assertTrue(np.all(frame == 2))
+
+    def test_read_retries_when_producer_wraps_onto_the_slot(self):
+        ring = FrameRing(slots=3)
+        for value in (1, 2):
+            self.publish(ring, value)
+
+        # Three more frames while copying frame 2: the third lands in its slot
+        self.interrupt_newest(ring, 3, 4, 5)
+        frame = ring.read()
+
+        # The torn (half 2, half 5) copy is discarded for the newest intact frame
+        self.assertEqual(ring.seq, 5)
+        self.assertTrue(np.all(frame == 5), f"torn frame returned:\n{frame}")
+
+    def test_read_keeps_copy_when_producer_stays_clear_of_the_slot(self):
+        ring = FrameRing(slots=3)
+        for value in (1, 2):
+            self.publish(ring, value)
+
+        # One frame while copying frame 2 goes to another slot; no retry needed
+        self.interrupt_newest(ring, 3)
+        frame = ring.read()
+
+        self.assertEqual(ring.seq, 3)
+        self.assertTrue(np.all(frame == 2))
+
+if __name__ == '__main__':
+    unittest.main()
@@ -51,9 +51,19 @@ class RealtimeSpatialize:
         self.elevation = 0.0
         self.current_frame = 0
 
+        # All HRIRs as one (sources, taps, 2) array, so the callback needs no slab objects
+        self.fir_bank = np.stack([fir.data for fir in self.hrtf.data])
+        self.n_taps = self.fir_bank.shape[1]
+        self.spectra = {}  # (source index, fft size) -> filter spectrum, filled on first use
+        self.tail = np.zeros((self.n_taps - 1, 2))  # Convolution overlap into the next chunk
+        self.source_index = self.hrtf.cone_sources(self.azimuth, self.elevation)[0]
+
     def set_position(self, azimuth, elevation):
         self.azimuth = azimuth
         self.elevation = elevation
+        # Use the library's built-in function to find the index of the closest source.
+        # Done here on the control thread so the audio callback only reads the index.
+        self.source_index = self.hrtf.cone_sources(azimuth, elevation)[0]
 
     def audio_callback(self, outdata, frames, time, status):
         if status:
@@ -65,25 +75,23 @@ class RealtimeSpatialize:
             chunk_mono_data = self.mono_sound_data[indices]
             self.current_frame = (self.current_frame + frames) % sound_len
             
-            chunk_sound_obj = slab.Sound(chunk_mono_data, samplerate=self.samplerate)
-
-            # 2. --- THE CORRECT METHOD ---
-            # Use the library's built-in function to find the index of the closest source.
-            # This replaces the manual nearest-neighbor calculation.
-            closest_source_index = self.hrtf.cone_sources(self.azimuth, self.elevation)[0]
+            # 2. Look up the spectrum of the current source's filter (cached per position).
+            source_index = self.source_index
+            n_fft = 1 << (frames + self.n_taps - 2).bit_length()  # >= full convolution length
+            spectrum = self.spectra.get((source_index, n_fft))
+            if spectrum is None:
+                spectrum = np.fft.rfft(self.fir_bank[source_index], n_fft, axis=0)
+                self.spectra[(source_index, n_fft)] = spectrum
             
-            # 3. Select the specific filter from the HRTF bank using the found index.
-            fir_filter = self.hrtf[closest_source_index]
+            # 3. Convolve the chunk with both ear filters in the frequency domain.
+            filtered = np.fft.irfft(np.fft.rfft(chunk_mono_data, n_fft)[:, None] * spectrum, n_fft, axis=0)
             
-            # 4. Apply that filter to the sound chunk.
-            filtered_chunk = fir_filter.apply(chunk_sound_obj)
+            # 4. Overlap-add: the previous chunk's filter tail continues into this one.
+            filtered[:self.n_taps - 1] += self.tail
+            self.tail = filtered[frames:frames + self.n_taps - 1].copy()
             
             # 5. Write the resulting stereo data to the output buffer.
-            output_len = min(frames, filtered_chunk.n_samples)
-            outdata[:output_len] = filtered_chunk.data[:output_len, :]
-            
-            if output_len < frames:
-                outdata[output_len:] = 0
+            outdata[:] = filtered[:frames]
 
         except Exception as e:
             print(f"\n--- EXCEPTION IN CALLBACK: {e} ---")
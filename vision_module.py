@@ -47,6 +47,11 @@ class VisionController:
         self.search_result = None
         self.search_lock = threading.Lock()
         
+        # Adaptive detection skip (automatic re-acquisition only)
+        self._skip_p = config.FRAME_SKIP_DETECTION
+        self._frames_since_detect = 0
+        self._prev_small = None
+        
         # Initialize Gemini client
         try:
             self.gemini_client = genai.Client(api_key=config.API_KEY)
@@ -78,7 +83,11 @@ class VisionController:
                     # Set resolution to 1280x720 as requested
                     cap.set(cv2.CAP_PROP_FRAME_WIDTH, 1280)
                     cap.set(cv2.CAP_PROP_FRAME_HEIGHT, 720)
-                    
+
+                    # OPTIMIZATION: Keep at most one queued frame so read() returns the newest one
+                    # (ignored by backends that don't support it)
+                    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+
                     actual_w = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
                     actual_h = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
                     print(f"🎥 Resolution set to: {actual_w}x{actual_h} (MJPG)")
@@ -231,6 +240,41 @@ class VisionController:
         # Return result outside of lock context
         return result
     
+    def should_auto_detect(self, frame):
+        """
+        Decide whether automatic detection is due on this frame.
+        
+        The skip length adapts to the scene: it grows while consecutive frames
+        barely change, halves when they change a lot, and doubles when a
+        detection is still in flight when the next one falls due.
+        
+        Args:
+            frame: Current video frame
+        
+        Returns:
+            True if a detection should be started now
+        """
+        small = cv2.cvtColor(cv2.resize(frame, config.SCENE_DIFF_SIZE, interpolation=cv2.INTER_AREA),
+                             cv2.COLOR_BGR2GRAY)
+        if self._prev_small is not None:
+            diff = cv2.absdiff(self._prev_small, small).mean()
+            if diff < config.SCENE_DIFF_LOW:
+                self._skip_p = min(self._skip_p + 1, config.FRAME_SKIP_MAX)
+            elif diff > config.SCENE_DIFF_HIGH:
+                self._skip_p = max(self._skip_p // 2, 1)
+        self._prev_small = small
+        
+        self._frames_since_detect += 1
+        if self._frames_since_detect < self._skip_p:
+            return False
+        
+        self._frames_since_detect = 0
+        if self.is_searching:
+            # Detector is falling behind - back off
+            self._skip_p = min(self._skip_p * 2, config.FRAME_SKIP_MAX)
+            return False
+        return True
+    
     def read_frame(self):
         """Reads a frame from the camera."""
         if self.cap:
@@ -292,16 +336,17 @@ class VisionController:
         Returns:
             List of detection dicts or empty list
         """
-        cv2.imwrite(config.TEMP_IMAGE_FILE, frame, [cv2.IMWRITE_PNG_COMPRESSION, 0])  # No compression
-        
         try:
-            with open(config.TEMP_IMAGE_FILE, "rb") as f:
-                image_bytes = f.read()
+            # Encode in memory - no temp file round-trip, and a far smaller upload than raw PNG
+            ok, encoded = cv2.imencode('.jpg', frame, [cv2.IMWRITE_JPEG_QUALITY, config.DETECTION_JPEG_QUALITY])
+            if not ok:
+                print("❌ Failed to encode frame for detection")
+                return []
             
             response = self.gemini_client.models.generate_content(
                 model=config.MODEL_ID,
                 contents=[
-                    types.Part.from_bytes(data=image_bytes, mime_type="image/png"),
+                    types.Part.from_bytes(data=encoded.tobytes(), mime_type="image/jpeg"),
                     prompt
                 ],
                 config=types.GenerateContentConfig(
@@ -310,8 +355,6 @@ class VisionController:
                 )
             )
             
-            os.remove(config.TEMP_IMAGE_FILE)
-            
             # Parse JSON response (removed verbose debug for performance)
             detections = None
             
@@ -340,13 +383,9 @@ class VisionController:
         except json.JSONDecodeError as e:
             print(f"❌ JSON parsing error: {e}")
             print(f"   Attempted to parse: {cleaned_text[:200] if 'cleaned_text' in locals() else 'N/A'}")
-            if os.path.exists(config.TEMP_IMAGE_FILE):
-                os.remove(config.TEMP_IMAGE_FILE)
             return []
         except Exception as e:
             print(f"❌ Error during Gemini multi-object detection: {e}")
-            if os.path.exists(config.TEMP_IMAGE_FILE):
-                os.remove(config.TEMP_IMAGE_FILE)
             return []
     
     def _async_reacquire_multi_worker(self, frame, prompt):
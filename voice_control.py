@@ -43,6 +43,16 @@ class VoiceController:
     STT_CHUNK = 2048       # Reduced for latency
     STT_DTYPE = "int16"    # Standard for speech
     
+    # Fast-path visual keywords, compiled into one alternation so the
+    # transcript is scanned once instead of once per keyword
+    VISUAL_KEYWORDS = [
+        "see", "look", "what is this", "describe", "read", "identify",
+        "what's this", "whats this", "tell me what", "what do you think",
+        "try again", "again", "better view", "different", "use your visual",
+        "use the visual", "check", "analyze", "examine"
+    ]
+    VISUAL_KEYWORDS_RE = re.compile("|".join(re.escape(w) for w in VISUAL_KEYWORDS))
+    
     def __init__(self):
         """Initialize advanced voice controller."""
         # STT state
@@ -403,13 +413,7 @@ class VoiceController:
         # FAST PATH: Check for explicit visual keywords to save latency
         # (Still useful for obvious cases)
         lower_text = text.lower()
-        visual_keywords = [
-            "see", "look", "what is this", "describe", "read", "identify",
-            "what's this", "whats this", "tell me what", "what do you think",
-            "try again", "again", "better view", "different", "use your visual",
-            "use the visual", "check", "analyze", "examine"
-        ]
-        if any(w in lower_text for w in visual_keywords):
+        if self.VISUAL_KEYWORDS_RE.search(lower_text):
             print("⚡ Fast Path: Visual Query detected")
             return {"intent": "visual_qa", "params": {"question": text}}
 